@@ -1,5 +1,10 @@
 from bitvavo_api_upgraded.bitvavo import Bitvavo
-from bitvavo_api_upgraded.settings import BitvavoApiUpgradedSettings, BitvavoSettings
+from bitvavo_api_upgraded.settings import (
+    BitvavoApiUpgradedSettings,
+    BitvavoSettings,
+    get_bitvavo_settings,
+    get_upgraded_settings,
+)
 from bitvavo_api_upgraded.type_aliases import OutputFormat
 
 __all__ = [
@@ -7,4 +12,6 @@ __all__ = [
     "BitvavoApiUpgradedSettings",
     "BitvavoSettings",
     "OutputFormat",
+    "get_bitvavo_settings",
+    "get_upgraded_settings",
 ]
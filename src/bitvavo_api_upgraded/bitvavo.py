@@ -6,6 +6,7 @@ import json
 import statistics
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
 from pathlib import Path
 from threading import Thread
 from typing import TYPE_CHECKING, Any
@@ -15,9 +16,9 @@ from httpx import delete, get, post, put
 from structlog.stdlib import get_logger
 from websocket import WebSocketApp  # missing stubs for WebSocketApp
 
+from bitvavo_api_upgraded import settings
 from bitvavo_api_upgraded.dataframe_utils import convert_candles_to_dataframe, convert_to_dataframe
 from bitvavo_api_upgraded.helper_funcs import configure_loggers, time_ms, time_to_wait
-from bitvavo_api_upgraded.settings import bitvavo_settings, bitvavo_upgraded_settings
 from bitvavo_api_upgraded.type_aliases import OutputFormat, anydict, errordict, intdict, ms, s_f, strdict, strintdict
 from bitvavo_client.auth.signing import create_signature
 from bitvavo_client.endpoints.common import (
@@ -32,11 +33,15 @@ from bitvavo_client.endpoints.common import (
 if TYPE_CHECKING:
     from collections.abc import Callable
 
-configure_loggers()
-
 logger = get_logger(__name__)
 
 
+@cache
+def _configure_loggers_once() -> None:
+    """Set up logging when the first `Bitvavo` is created; doing it on import would build the settings."""
+    configure_loggers()
+
+
 def process_local_book(ws: Bitvavo.WebSocketAppFacade, message: anydict) -> None:
     market: str = ""
     if "action" in message:
@@ -197,14 +202,15 @@ class Bitvavo:
     """
 
     def __init__(self, options: dict[str, str | int | list[dict[str, str]]] | None = None) -> None:
+        _configure_loggers_once()
         if options is None:
             options = {}
         _options = {k.upper(): v for k, v in options.items()}
 
         # Options take precedence over settings
-        self.base: str = str(_options.get("RESTURL", bitvavo_settings.RESTURL))
-        self.wsUrl: str = str(_options.get("WSURL", bitvavo_settings.WSURL))
-        self.ACCESSWINDOW: int = int(_options.get("ACCESSWINDOW", bitvavo_settings.ACCESSWINDOW))
+        self.base: str = str(_options.get("RESTURL", settings.bitvavo_settings.RESTURL))
+        self.wsUrl: str = str(_options.get("WSURL", settings.bitvavo_settings.WSURL))
+        self.ACCESSWINDOW: int = int(_options.get("ACCESSWINDOW", settings.bitvavo_settings.ACCESSWINDOW))
 
         # Support for multiple API keys - options take absolute precedence
         if "APIKEY" in _options and "APISECRET" in _options:
@@ -221,13 +227,13 @@ class Bitvavo:
                 self.api_keys = []
         else:
             # Fall back to settings only if no API key options provided
-            api_keys = bitvavo_settings.APIKEYS
+            api_keys = settings.bitvavo_settings.APIKEYS
             if isinstance(api_keys, list) and api_keys:
                 self.api_keys = api_keys
             else:
                 # Single API key from settings (backward compatibility)
-                single_key = str(bitvavo_settings.APIKEY)
-                single_secret = str(bitvavo_settings.APISECRET)
+                single_key = str(settings.bitvavo_settings.APIKEY)
+                single_secret = str(settings.bitvavo_settings.APISECRET)
                 if single_key and single_secret:
                     self.api_keys = [{"key": single_key, "secret": single_secret}]
                 else:
@@ -243,26 +249,28 @@ class Bitvavo:
         # Rate limiting per API key
         self.rate_limits: dict[int, dict[str, int | ms]] = {}
         # Get default rate limit from options or settings
-        default_rate_limit_option = _options.get("DEFAULT_RATE_LIMIT", bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT)
+        default_rate_limit_option = _options.get(
+            "DEFAULT_RATE_LIMIT", settings.bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT
+        )
         default_rate_limit = (
             int(default_rate_limit_option)
             if isinstance(default_rate_limit_option, (int, str))
-            else bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT
+            else settings.bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT
         )
 
         for i in range(len(self.api_keys)):
             self.rate_limits[i] = {"remaining": default_rate_limit, "resetAt": ms(0)}
 
         # Legacy properties for backward compatibility
-        self.APIKEY: str = self.api_keys[0]["key"] if self.api_keys else ""
-        self.APISECRET: str = self.api_keys[0]["secret"] if self.api_keys else ""
+        self.APIKEY: str = self.api_keys[0]["key"]
+        self.APISECRET: str = self.api_keys[0]["secret"]
         self._current_api_key: str = self.APIKEY
         self._current_api_secret: str = self.APISECRET
         self.rateLimitRemaining: int = default_rate_limit
         self.rateLimitResetAt: ms = 0
 
         # Options take precedence over settings for debugging
-        self.debugging: bool = bool(_options.get("DEBUGGING", bitvavo_settings.DEBUGGING))
+        self.debugging: bool = bool(_options.get("DEBUGGING", settings.bitvavo_settings.DEBUGGING))
 
     def get_best_api_key_config(self, rateLimitingWeight: int = 1) -> tuple[str, str, int]:
         """Get the best API key configuration to use for a request."""
@@ -283,7 +291,7 @@ class Bitvavo:
         if key_index not in self.rate_limits:
             return False
         remaining = self.rate_limits[key_index]["remaining"]
-        return (remaining - weight) > bitvavo_upgraded_settings.RATE_LIMITING_BUFFER
+        return (remaining - weight) > settings.bitvavo_upgraded_settings.RATE_LIMITING_BUFFER
 
     def _update_rate_limit_for_key(self, key_index: int, response: anydict | errordict) -> None:
         """Update rate limit for a specific API key index."""
@@ -533,7 +541,7 @@ class Bitvavo:
                 info={"url": url, "key_index": key_index},
             )
 
-        now = time_ms() + bitvavo_upgraded_settings.LAG
+        now = time_ms() + settings.bitvavo_upgraded_settings.LAG
         sig = create_signature(now, "GET", url.replace(self.base, ""), None, api_secret)
         headers = {
             "bitvavo-access-key": api_key,
@@ -605,7 +613,7 @@ class Bitvavo:
         self._current_api_key = api_key
         self._current_api_secret = api_secret
 
-        now = time_ms() + bitvavo_upgraded_settings.LAG
+        now = time_ms() + settings.bitvavo_upgraded_settings.LAG
         sig = create_signature(now, method, (endpoint + postfix), body, api_secret)
         url = self.base + endpoint + postfix
         headers = {
@@ -2320,7 +2328,7 @@ class Bitvavo:
 
         # Initialize rate limit tracking for this key using settings default
         key_index = len(self.api_keys) - 1
-        default_rate_limit = bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT
+        default_rate_limit = settings.bitvavo_upgraded_settings.DEFAULT_RATE_LIMIT
         self.rate_limits[key_index] = {"remaining": default_rate_limit, "resetAt": ms(0)}
 
         logger.info("api-key-added", key_index=key_index)
@@ -2608,7 +2616,7 @@ class Bitvavo:
                     self.subscription_book(market, self.callbacks["subscriptionBookUser"][market])
 
         def on_open(self, ws: Any) -> None:  # noqa: ARG002
-            now = time_ms() + bitvavo_upgraded_settings.LAG
+            now = time_ms() + settings.bitvavo_upgraded_settings.LAG
             self.open = True
             self.reconnectTimer = 0.5
             if self.APIKEY != "":
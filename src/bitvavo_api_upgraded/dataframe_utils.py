@@ -8,10 +8,16 @@ pandas, polars, cuDF, modin, pyarrow, dask, duckdb, ibis, pyspark, and more.
 
 from __future__ import annotations
 
-from typing import Any
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 from bitvavo_api_upgraded.type_aliases import OutputFormat
 
+if TYPE_CHECKING:
+    from narwhals.typing import EagerAllowed
+
+_CANDLE_COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+
 
 def is_narwhals_available() -> bool:
     """Check if narwhals is available."""
@@ -88,7 +94,10 @@ def validate_output_format(output_format: str | OutputFormat) -> None:
 
 
 def convert_to_dataframe(data: Any, output_format: str | OutputFormat) -> Any:
-    """Convert data to the specified dataframe format."""
+    """Convert data to the specified dataframe format.
+
+    Input that is neither a list nor Arrow data, such as an already built (lazy) frame, is returned as is.
+    """
     # Normalize the output format first
     format_enum = _normalize_output_format(output_format)
 
@@ -97,10 +106,18 @@ def convert_to_dataframe(data: Any, output_format: str | OutputFormat) -> Any:
     if format_enum == OutputFormat.DICT:
         return data
 
+    if hasattr(data, "__arrow_c_stream__"):
+        return _convert_arrow_data(data, format_enum)
+
     if not isinstance(data, list) or not data:
         # If it's not a list or empty, return as-is for dict format compatibility
         return data
 
+    return _convert_tabular_data(data, format_enum)
+
+
+def _convert_tabular_data(data: list[Any] | dict[str, list[Any]], format_enum: OutputFormat) -> Any:
+    """Convert rows (a list of dicts) or columns (a dict of lists) to the requested dataframe format."""
     # Use Narwhals for conversion - it handles all supported libraries automatically
     import narwhals as nw  # noqa: PLC0415
 
@@ -113,13 +130,51 @@ def convert_to_dataframe(data: Any, output_format: str | OutputFormat) -> Any:
         # Use pandas as intermediate format for most cases
         import pandas as pd  # noqa: PLC0415
 
-        native_df = pd.DataFrame(data)
+        # copy=False lets column input (e.g. numpy arrays) back the dataframe directly
+        native_df = pd.DataFrame(data, copy=False)
 
     # Convert through narwhals to ensure compatibility
     nw_df = nw.from_native(native_df)
+    if format_enum == OutputFormat.POLARS:
+        return nw_df.to_polars()
+    if format_enum == OutputFormat.PYARROW:
+        return nw_df.to_arrow()
     return nw_df.to_native()
 
 
+@cache
+def _arrow_backends() -> dict[OutputFormat, EagerAllowed]:
+    """Map the formats narwhals can build straight from Arrow data to their narwhals backend.
+
+    Built on first use, as narwhals is an optional dependency.
+    """
+    import narwhals as nw  # noqa: PLC0415
+
+    return {
+        OutputFormat.PANDAS: nw.Implementation.PANDAS,
+        OutputFormat.POLARS: nw.Implementation.POLARS,
+        OutputFormat.PYARROW: nw.Implementation.PYARROW,
+        OutputFormat.MODIN: nw.Implementation.MODIN,
+        OutputFormat.CUDF: nw.Implementation.CUDF,
+    }
+
+
+def _convert_arrow_data(data: Any, output_format: OutputFormat) -> Any:
+    """Convert Arrow tabular data (a pyarrow Table or RecordBatch, or anything else exposing `__arrow_c_stream__`).
+
+    The columns are handed over through the Arrow C stream interface, so no Python row objects get built.
+    """
+    import narwhals as nw  # noqa: PLC0415
+
+    backend = _arrow_backends().get(output_format)
+    if backend is not None:
+        return nw.from_arrow(data, backend=backend).to_native()
+
+    # Other formats are built from a pandas dataframe, same as for list input
+    pdf = nw.from_arrow(data, backend=nw.Implementation.PANDAS).to_native()
+    return _create_special_dataframe(pdf, output_format)
+
+
 def _create_special_dataframe(data: Any, output_format: OutputFormat) -> Any:
     """Create special dataframes that need custom handling."""
     if output_format == OutputFormat.DASK:
@@ -150,6 +205,8 @@ def convert_candles_to_dataframe(data: Any, output_format: str | OutputFormat) -
 
     Candlestick data comes as list of lists:
     [[timestamp, open, high, low, close, volume], ...]
+
+    Data that is already columnar, a dict with a sequence or array per candle column, is used as is.
     """
     # Normalize the output format first
     format_enum = _normalize_output_format(output_format)
@@ -159,19 +216,17 @@ def convert_candles_to_dataframe(data: Any, output_format: str | OutputFormat) -
     if format_enum == OutputFormat.DICT:
         return data
 
+    if isinstance(data, dict) and all(column in data for column in _CANDLE_COLUMNS):
+        return _convert_tabular_data({column: data[column] for column in _CANDLE_COLUMNS}, format_enum)
+
     if not isinstance(data, list) or not data:
         return data
 
-    # Convert list of lists to list of dicts first
-    columns = ["timestamp", "open", "high", "low", "close", "volume"]
-    dict_data = [
-        dict(zip(columns, candle, strict=True))
-        for candle in data
-        if isinstance(candle, list) and len(candle) >= len(columns)
-    ]
+    candles = [candle for candle in data if isinstance(candle, list) and len(candle) >= len(_CANDLE_COLUMNS)]
 
-    if not dict_data:
+    if not candles:
         return data
 
-    # Reuse the standard conversion function for consistency
-    return convert_to_dataframe(dict_data, format_enum)
+    # Transpose into one list per column, instead of building a dict per candle
+    column_data = dict(zip(_CANDLE_COLUMNS, map(list, zip(*candles, strict=False)), strict=False))
+    return _convert_tabular_data(column_data, format_enum)
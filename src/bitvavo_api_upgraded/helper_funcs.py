@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING
 
 import structlog
 
-from bitvavo_api_upgraded.settings import BITVAVO_API_UPGRADED
+from bitvavo_api_upgraded import settings
 from bitvavo_api_upgraded.type_aliases import ms, s_f
 
 if TYPE_CHECKING:
@@ -66,7 +66,7 @@ def configure_loggers() -> None:
             "handlers": {
                 "console_handler": {
                     "class": "logging.StreamHandler",
-                    "level": BITVAVO_API_UPGRADED.LOG_LEVEL,
+                    "level": settings.BITVAVO_API_UPGRADED.LOG_LEVEL,
                     "formatter": "console_formatter",
                     "stream": "ext://sys.stderr",
                 },
@@ -74,7 +74,7 @@ def configure_loggers() -> None:
             "loggers": {
                 "": {
                     "handlers": ["console_handler"],
-                    "level": BITVAVO_API_UPGRADED.LOG_EXTERNAL_LEVEL,
+                    "level": settings.BITVAVO_API_UPGRADED.LOG_EXTERNAL_LEVEL,
                     "propagate": True,
                 },
             },
@@ -1,14 +1,61 @@
 from __future__ import annotations
 
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
 from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from bitvavo_api_upgraded.type_aliases import ms
 
+_VALID_LOG_LEVELS = frozenset(("CRITICAL", "FATAL", "ERROR", "WARN", "WARNING", "INFO", "DEBUG", "NOTSET"))
+
+COMMON_SSL_CERT_PATHS: tuple[str, ...] = (
+    "/etc/ssl/certs/ca-certificates.crt",  # Debian/Ubuntu/NixOS
+    "/etc/ssl/certs/ca-bundle.crt",  # CentOS/RHEL/Fedora
+    "/etc/ssl/cert.pem",  # OpenBSD/macOS
+    "/usr/local/share/certs/ca-root-nss.crt",  # FreeBSD
+    "/etc/pki/tls/certs/ca-bundle.crt",  # Old CentOS/RHEL
+)
+
+
+def _group_by_directory(paths: tuple[str, ...]) -> dict[str, tuple[str, ...]]:
+    """Group file paths by their directory, keeping the order they were given in."""
+    grouped: dict[str, tuple[str, ...]] = {}
+    for path in paths:
+        directory, name = os.path.split(path)
+        grouped[directory] = (*grouped.get(directory, ()), name)
+    return grouped
+
+
+_SSL_CERT_CANDIDATES = _group_by_directory(COMMON_SSL_CERT_PATHS)
+
+
+@lru_cache(maxsize=1)
+def _detect_ssl_cert() -> str | None:
+    """
+    Return the first existing path from COMMON_SSL_CERT_PATHS, or None.
+
+    Each candidate directory is listed once with `os.scandir`, instead of calling `stat()` on every candidate path.
+    Only a matching entry that turns out to be a symlink costs an extra `stat()`, to make sure it isn't dangling.
+
+    The result is memoized, so the filesystem is only probed once per process.
+    Child processes inherit the `SSL_CERT_FILE` environment variable that
+    `configure_ssl_certificate` sets, so they skip the probe altogether.
+    """
+    for directory, names in _SSL_CERT_CANDIDATES.items():
+        try:
+            with os.scandir(directory) as entries:
+                found = {entry.name for entry in entries if entry.name in names and entry.is_file()}
+        except OSError:
+            continue
+        for name in names:
+            if name in found:
+                return f"{directory}/{name}"
+    return None
+
 
 class BitvavoApiUpgradedSettings(BaseSettings):
     """
@@ -37,7 +84,7 @@ class BitvavoApiUpgradedSettings(BaseSettings):
 
     # Configuration for Pydantic Settings
     model_config: SettingsConfigDict = SettingsConfigDict(
-        env_file=Path.cwd() / ".env",
+        env_file=".env",  # resolved against the cwd when the settings are built
         env_file_encoding="utf-8",
         env_prefix="BITVAVO_API_UPGRADED_",
         extra="ignore",
@@ -46,34 +93,26 @@ class BitvavoApiUpgradedSettings(BaseSettings):
     @field_validator("LOG_LEVEL", "LOG_EXTERNAL_LEVEL", mode="before")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
-        valid_levels = {"CRITICAL", "FATAL", "ERROR", "WARN", "WARNING", "INFO", "DEBUG", "NOTSET"}
-        if v.upper() not in valid_levels:
-            msg = f"Invalid log level: {v}. Must be one of: {', '.join(valid_levels)}"
+        level = v.upper()
+        if level not in _VALID_LOG_LEVELS:
+            msg = f"Invalid log level: {v}. Must be one of: {', '.join(sorted(_VALID_LOG_LEVELS))}"
             raise ValueError(msg)
-        return v.upper()
+        return level
 
     @model_validator(mode="after")
     def configure_ssl_certificate(self) -> BitvavoApiUpgradedSettings:
         """Configure SSL certificate file path and set environment variable if needed."""
-        if self.SSL_CERT_FILE is None and "SSL_CERT_FILE" not in os.environ:
-            # Try to auto-detect SSL certificate file only if not already set in environment
-            common_ssl_cert_paths = [
-                "/etc/ssl/certs/ca-certificates.crt",  # Debian/Ubuntu/NixOS
-                "/etc/ssl/certs/ca-bundle.crt",  # CentOS/RHEL/Fedora
-                "/etc/ssl/cert.pem",  # OpenBSD/macOS
-                "/usr/local/share/certs/ca-root-nss.crt",  # FreeBSD
-                "/etc/pki/tls/certs/ca-bundle.crt",  # Old CentOS/RHEL
-            ]
-
-            for cert_path in common_ssl_cert_paths:
-                if Path(cert_path).exists():
-                    self.SSL_CERT_FILE = cert_path
-                    break
-
-        # Set the environment variable if we have a certificate file
-        if self.SSL_CERT_FILE and Path(self.SSL_CERT_FILE).exists():
+        if not self.SSL_CERT_FILE:
+            # An empty value counts as unset
+            if "SSL_CERT_FILE" not in os.environ:
+                # Try to auto-detect SSL certificate file only if not already set in environment.
+                # Detection only returns paths it found on disk, so there's no need to check again.
+                self.SSL_CERT_FILE = _detect_ssl_cert()
+                if self.SSL_CERT_FILE:
+                    os.environ["SSL_CERT_FILE"] = self.SSL_CERT_FILE
+        elif Path(self.SSL_CERT_FILE).is_file():
             os.environ["SSL_CERT_FILE"] = self.SSL_CERT_FILE
-        elif self.SSL_CERT_FILE:
+        else:
             # User specified a path but it doesn't exist
             msg = f"SSL certificate file not found: {self.SSL_CERT_FILE}"
             raise FileNotFoundError(msg)
@@ -102,7 +141,7 @@ class BitvavoSettings(BaseSettings):
 
     # Configuration for Pydantic Settings
     model_config = SettingsConfigDict(
-        env_file=Path.cwd() / ".env",
+        env_file=".env",  # resolved against the cwd when the settings are built
         env_file_encoding="utf-8",
         env_prefix="BITVAVO_",
         extra="ignore",
@@ -110,8 +149,10 @@ class BitvavoSettings(BaseSettings):
 
     @model_validator(mode="after")
     def set_api_rating_limit_per_second(self) -> BitvavoSettings:
-        # Create a new value instead of modifying the Field directly
-        object.__setattr__(self, "API_RATING_LIMIT_PER_SECOND", self.API_RATING_LIMIT_PER_SECOND // 60)
+        """Derive the per-second limit from the per-minute limit, unless it was set explicitly."""
+        if "API_RATING_LIMIT_PER_SECOND" not in self.model_fields_set:
+            # Create a new value instead of modifying the Field directly
+            object.__setattr__(self, "API_RATING_LIMIT_PER_SECOND", self.API_RATING_LIMIT_PER_MINUTE // 60)
         return self
 
     @model_validator(mode="after")
@@ -124,8 +165,46 @@ class BitvavoSettings(BaseSettings):
         return self
 
 
-# Initialize the settings
-bitvavo_upgraded_settings = BitvavoApiUpgradedSettings()
-BITVAVO_API_UPGRADED = bitvavo_upgraded_settings
-bitvavo_settings = BitvavoSettings()
-BITVAVO = bitvavo_settings
+@lru_cache(maxsize=1)
+def get_upgraded_settings() -> BitvavoApiUpgradedSettings:
+    """
+    Return the shared BitvavoApiUpgradedSettings instance.
+
+    This is the canonical way to get the settings: `.env` is only parsed (and
+    the validators only run) on the first call. Use `get_upgraded_settings.cache_clear()`
+    if you need to reload them.
+    """
+    return BitvavoApiUpgradedSettings()
+
+
+@lru_cache(maxsize=1)
+def get_bitvavo_settings() -> BitvavoSettings:
+    """
+    Return the shared BitvavoSettings instance.
+
+    This is the canonical way to get the settings: `.env` is only parsed (and
+    the validators only run) on the first call. Use `get_bitvavo_settings.cache_clear()`
+    if you need to reload them.
+    """
+    return BitvavoSettings()
+
+
+if TYPE_CHECKING:
+    bitvavo_upgraded_settings: BitvavoApiUpgradedSettings
+    BITVAVO_API_UPGRADED: BitvavoApiUpgradedSettings
+    bitvavo_settings: BitvavoSettings
+    BITVAVO: BitvavoSettings
+
+
+def __getattr__(name: str) -> BitvavoApiUpgradedSettings | BitvavoSettings:
+    """
+    Build the module-level settings on first access (PEP 562), instead of at
+    import time, so importing this module doesn't read `.env` or probe for SSL
+    certificates.
+    """
+    if name in ("bitvavo_upgraded_settings", "BITVAVO_API_UPGRADED"):
+        return get_upgraded_settings()
+    if name in ("bitvavo_settings", "BITVAVO"):
+        return get_bitvavo_settings()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
@@ -1,9 +1,31 @@
 """Modern, modular Bitvavo API client."""
 
-from bitvavo_client.core.settings import BitvavoSettings
-from bitvavo_client.facade import BitvavoClient
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bitvavo_client.core.settings import ApiKey, BitvavoSettings, get_core_settings
+
+if TYPE_CHECKING:
+    from bitvavo_client.facade import BitvavoClient
 
 __all__ = [
+    "ApiKey",
     "BitvavoClient",
     "BitvavoSettings",
+    "get_core_settings",
 ]
+
+
+def __getattr__(name: str) -> type[BitvavoClient]:
+    """Import the client on first access (PEP 562).
+
+    The facade pulls in the transport, endpoint and model modules, so importing `bitvavo_client` for just the
+    settings shouldn't pay for that.
+    """
+    if name == "BitvavoClient":
+        from bitvavo_client.facade import BitvavoClient  # noqa: PLC0415
+
+        return BitvavoClient
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
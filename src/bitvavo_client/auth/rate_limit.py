@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 import time
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
 from structlog.stdlib import get_logger
 
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Mapping
+
 logger = get_logger()
 
 
@@ -107,12 +110,12 @@ class RateLimitManager:
             new_remaining=self.state[idx]["remaining"],
         )
 
-    def update_from_headers(self, idx: int, headers: dict[str, str]) -> None:
+    def update_from_headers(self, idx: int, headers: Mapping[str, str]) -> None:
         """Update rate limit state from response headers.
 
         Args:
             idx: API key index
-            headers: HTTP response headers
+            headers: HTTP response headers; `httpx.Headers` can be passed as-is
         """
         self.ensure_key(idx)
 
@@ -8,8 +8,31 @@ import json
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+
     from bitvavo_client.core.types import AnyDict
 
+    Signer = Callable[[int, str, str, bytes], str]
+
+
+def encode_body(body: AnyDict | None) -> bytes:
+    """Serialize a request body to the compact JSON that is both signed and sent.
+
+    Args:
+        body: Request body as dictionary (optional)
+
+    Returns:
+        Compact JSON as bytes, or empty bytes when there is no body
+    """
+    if body is None or len(body) == 0:
+        return b""
+    return json.dumps(body, separators=(",", ":")).encode("utf-8")
+
+
+def _signature_message(timestamp: int, method: str, url: str, content: bytes) -> bytes:
+    """Build the message that gets signed: timestamp, method, versioned URL and encoded body."""
+    return f"{timestamp}{method}/v2{url}".encode() + content
+
 
 def create_signature(timestamp: int, method: str, url: str, body: AnyDict | None, api_secret: str) -> str:
     """Create HMAC-SHA256 signature for Bitvavo API authentication.
@@ -24,10 +47,30 @@ def create_signature(timestamp: int, method: str, url: str, body: AnyDict | None
     Returns:
         HMAC-SHA256 signature as hexadecimal string
     """
-    string = f"{timestamp}{method}/v2{url}"
-    if body is not None and len(body) > 0:
-        string += json.dumps(body, separators=(",", ":"))
-
-    signature = hmac.new(api_secret.encode("utf-8"), string.encode("utf-8"), hashlib.sha256).hexdigest()
+    message = _signature_message(timestamp, method, url, encode_body(body))
+    signature = hmac.new(api_secret.encode("utf-8"), message, hashlib.sha256).hexdigest()
 
     return signature
+
+
+def create_signer(api_secret: str) -> Signer:
+    """Create a signing function bound to one API secret.
+
+    The HMAC key schedule is computed once here; each call copies that keyed state instead of setting it up again.
+    The returned function takes the body already encoded with `encode_body`, so the exact bytes that get signed can
+    also be sent, and produces the same signatures as `create_signature`.
+
+    Args:
+        api_secret: API secret key
+
+    Returns:
+        Function taking (timestamp, method, url, encoded body) and returning the hexadecimal signature
+    """
+    keyed = hmac.new(api_secret.encode("utf-8"), digestmod=hashlib.sha256)
+
+    def sign(timestamp: int, method: str, url: str, content: bytes) -> str:
+        mac = keyed.copy()
+        mac.update(_signature_message(timestamp, method, url, content))
+        return mac.hexdigest()
+
+    return sign
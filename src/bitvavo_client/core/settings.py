@@ -1,11 +1,21 @@
 from __future__ import annotations
 
-from pathlib import Path
+from collections.abc import Mapping
+from functools import lru_cache
+from typing import NamedTuple
 
-from pydantic import Field, model_validator
+from pydantic import Field, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+class ApiKey(NamedTuple):
+    """An API key, its secret and its rate limit (weight per minute)."""
+
+    key: str
+    secret: str
+    rate_limit: int = 1000
+
+
 class BitvavoSettings(BaseSettings):
     """
     Core Bitvavo API settings using Pydantic v2.
@@ -15,7 +25,7 @@ class BitvavoSettings(BaseSettings):
     """
 
     model_config = SettingsConfigDict(
-        env_file=Path.cwd() / ".env",
+        env_file=".env",  # resolved against the cwd when the settings are built
         env_file_encoding="utf-8",
         env_prefix="BITVAVO_",
         extra="ignore",
@@ -33,20 +43,48 @@ class BitvavoSettings(BaseSettings):
     rate_limit_buffer: int = Field(default=50, description="Rate limit buffer to avoid hitting limits")
     lag_ms: int = Field(default=0, description="Artificial lag to add to requests in milliseconds")
     debugging: bool = Field(default=False, description="Enable debug logging")
+    public_cache_ttl_s: float = Field(
+        default=0.0,
+        ge=0.0,
+        description="Seconds to cache public markets/assets responses for; 0 disables the cache",
+    )
 
     # API key configuration
     api_key: str = Field(default="", alias="BITVAVO_APIKEY", description="Primary API key")
     api_secret: str = Field(default="", alias="BITVAVO_APISECRET", description="Primary API secret")
 
     # Multiple API keys support
-    api_keys: list[dict[str, str]] = Field(
-        default_factory=list,
-        description="List of API key/secret pairs for multi-key support",
+    # Accepts `{"key": ..., "secret": ...}` mappings (other entries are ignored) as well as `(key, secret)` pairs
+    api_keys: tuple[ApiKey, ...] = Field(
+        default=(),
+        description="API key/secret pairs for multi-key support",
     )
 
+    @field_validator("api_keys", mode="before")
+    @classmethod
+    def drop_unknown_api_key_fields(cls, value: object) -> object:
+        """Ignore entries of `api_keys` mappings that aren't `ApiKey` fields, like the old `list[dict]` did."""
+        if isinstance(value, list | tuple):
+            return [
+                {name: item[name] for name in ApiKey._fields if name in item} if isinstance(item, Mapping) else item
+                for item in value
+            ]
+        return value
+
     @model_validator(mode="after")
     def process_api_keys(self) -> BitvavoSettings:
         """Process API keys from single key/secret into multi-key list."""
         if self.api_key and self.api_secret and not self.api_keys:
-            object.__setattr__(self, "api_keys", [{"key": self.api_key, "secret": self.api_secret}])
+            object.__setattr__(self, "api_keys", (ApiKey(self.api_key, self.api_secret),))
         return self
+
+
+@lru_cache(maxsize=1)
+def get_core_settings() -> BitvavoSettings:
+    """Return the shared BitvavoSettings instance.
+
+    This is the canonical way to get the settings: `.env` is only parsed (and the
+    validators only run) on the first call. Use `get_core_settings.cache_clear()`
+    if you need to reload them.
+    """
+    return BitvavoSettings()
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import contextlib
+from importlib import import_module
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from returns.result import Failure, Result, Success
@@ -211,7 +212,12 @@ def _create_dataframe_from_data(
 class BaseAPI:
     """Base class for API endpoint handlers providing model conversion utilities."""
 
-    _endpoint_models: Mapping[str, Any] = {}
+    __slots__ = ("default_schema", "http", "preferred_model")
+
+    # Endpoint type -> pydantic model class name in `_models_module`. Looked up by name so the model module, which
+    # builds every pydantic model at import time, is only imported when pydantic output is actually requested.
+    _models_module: str = ""
+    _endpoint_models: Mapping[str, str] = {}
     _default_schemas: Mapping[str, object] = {}
 
     def __init__(
@@ -256,8 +262,10 @@ class BaseAPI:
             return self.preferred_model, effective_schema
 
         if self.preferred_model == ModelPreference.PYDANTIC:
-            model_cls = self._endpoint_models.get(endpoint_type, dict)
-            return model_cls, schema
+            model_name = self._endpoint_models.get(endpoint_type)
+            if model_name is None:
+                return dict, schema
+            return getattr(import_module(self._models_module), model_name), schema
 
         return None, schema
 
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -36,10 +37,10 @@ def create_postfix(options: AnyDict | None) -> str:
     Returns:
         Query string with '?' prefix if options exist, empty string otherwise
     """
-    options = default(options, {})
-    params = [f"{key}={options[key]}" for key in options]
-    postfix = "&".join(params)
-    return f"?{postfix}" if len(options) > 0 else postfix
+    # Most endpoints are called without options, so skip building anything
+    if not options:
+        return ""
+    return "?" + "&".join([f"{key}={value}" for key, value in options.items()])
 
 
 def epoch_millis(dt_obj: dt.datetime) -> int:
@@ -67,6 +68,13 @@ def sort_and_insert(
     update: list[list[str]],
     compareFunc: Callable[[float, float], bool],
 ) -> list[list[str]] | dict[str, Any]:
+    # The book is kept sorted, so for the built-in comparators each price level can be found with a binary search
+    # instead of scanning (and float-converting) the whole book per update entry
+    if compareFunc is asks_compare:
+        return _bisect_insert(asks_or_bids, update, 1.0)
+    if compareFunc is bids_compare:
+        return _bisect_insert(asks_or_bids, update, -1.0)
+
     for updateEntry in update:
         entrySet: bool = False
         for j in range(len(asks_or_bids)):
@@ -86,3 +94,24 @@ def sort_and_insert(
         if not entrySet:
             asks_or_bids.append(updateEntry)
     return asks_or_bids
+
+
+def _bisect_insert(book: list[list[str]], update: list[list[str]], sign: float) -> list[list[str]]:
+    """Apply `update` to a sorted `book` in place, like the linear scan in `sort_and_insert`.
+
+    `sign` is 1.0 for asks (ascending prices) and -1.0 for bids (descending prices), so the keys are always ascending.
+    """
+    keys = [sign * float(level[0]) for level in book]
+    for entry in update:
+        key = sign * float(entry[0])
+        j = bisect_left(keys, key)
+        if j < len(keys) and keys[j] == key:
+            if float(entry[1]) > 0.0:
+                book[j] = entry
+            else:
+                del book[j]
+                del keys[j]
+        else:
+            book.insert(j, entry)
+            keys.insert(j, key)
+    return book
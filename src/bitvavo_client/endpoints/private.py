@@ -8,7 +8,6 @@ import httpx
 from returns.result import Failure, Result, Success
 
 from bitvavo_client.adapters.returns_adapter import BitvavoError
-from bitvavo_client.core import private_models
 from bitvavo_client.core.model_preferences import ModelPreference
 from bitvavo_client.endpoints.base import (
     _DATAFRAME_LIBRARY_MAP,
@@ -28,23 +27,46 @@ T = TypeVar("T")
 class PrivateAPI(BaseAPI):
     """Handles all private Bitvavo API endpoints requiring authentication."""
 
-    _endpoint_models: ClassVar[dict[str, Any]] = {
-        "account": private_models.Account,
-        "balance": private_models.Balances,
-        "orders": private_models.Orders,
-        "order": private_models.Order,
-        "trade_history": private_models.Trades,
-        "transaction_history": private_models.TransactionHistory,
-        "fees": private_models.Fees,
-        "deposit_history": private_models.DepositHistories,
-        "deposit": private_models.Deposit,
-        "withdrawals": private_models.Withdrawals,
-        "withdraw": private_models.WithdrawResponse,
-        "cancel_order": private_models.CancelOrderResponse,
+    __slots__ = ()
+
+    # Model class names in `bitvavo_client.core.private_models`; the module is only imported for pydantic output
+    _models_module = "bitvavo_client.core.private_models"
+    _endpoint_models: ClassVar[dict[str, str]] = {
+        "account": "Account",
+        "balance": "Balances",
+        "orders": "Orders",
+        "order": "Order",
+        "trade_history": "Trades",
+        "transaction_history": "TransactionHistory",
+        "fees": "Fees",
+        "deposit_history": "DepositHistories",
+        "deposit": "Deposit",
+        "withdrawals": "Withdrawals",
+        "withdraw": "WithdrawResponse",
+        "cancel_order": "CancelOrderResponse",
     }
 
     _default_schemas = DEFAULT_SCHEMAS
 
+    # (HTTP method, path, rate limit weight) per route
+    _routes: ClassVar[dict[str, tuple[str, str, int]]] = {
+        "account": ("GET", "/account", 1),
+        "balance": ("GET", "/balance", 5),
+        "place_order": ("POST", "/order", 1),
+        "update_order": ("PUT", "/order", 1),
+        "cancel_order": ("DELETE", "/order", 1),
+        "orders": ("GET", "/orders", 5),
+        "cancel_orders": ("DELETE", "/orders", 1),
+        "orders_open": ("GET", "/ordersOpen", 25),
+        "fees": ("GET", "/account/fees", 1),
+        "deposit": ("GET", "/deposit", 1),
+        "deposit_history": ("GET", "/depositHistory", 5),
+        "withdrawals": ("GET", "/withdrawalHistory", 1),
+        "transaction_history": ("GET", "/account/history", 1),
+        "trade_history": ("GET", "/trades", 5),
+        "withdraw": ("POST", "/withdrawal", 1),
+    }
+
     def __init__(
         self,
         http_client: HTTPClient,
@@ -55,6 +77,33 @@ class PrivateAPI(BaseAPI):
         """Initialize private API handler."""
         super().__init__(http_client, preferred_model=preferred_model, default_schema=default_schema)
 
+    def _call(
+        self,
+        route: str,
+        options: AnyDict | None = None,
+        *,
+        body: AnyDict | None = None,
+        weight: int | None = None,
+    ) -> Result[Any, BitvavoError | httpx.HTTPError]:
+        """Send the request for a route from `_routes`, straight to `self.http.request`.
+
+        Args:
+            route: Key into `_routes`
+            options: Optional query parameters
+            body: Optional request body
+            weight: Override for the route's default rate limit weight
+
+        Returns:
+            Result containing the raw JSON response or error
+        """
+        method, path, route_weight = self._routes[route]
+        return self.http.request(
+            method,
+            path + create_postfix(options) if options else path,
+            body=body,
+            weight=route_weight if weight is None else weight,
+        )
+
     def account(
         self,
         *,
@@ -91,7 +140,7 @@ class PrivateAPI(BaseAPI):
             return Failure(TypeError(msg))
 
         # Get raw data from API
-        raw_result = self.http.request("GET", "/account", weight=1)
+        raw_result = self._call("account")
         # Convert to desired format
         return self._convert_raw_result(raw_result, "account", model, schema)
 
@@ -111,10 +160,8 @@ class PrivateAPI(BaseAPI):
         Returns:
             Result containing balance information or error
         """
-        postfix = create_postfix(options)
-
         # Get raw data from API
-        raw_result = self.http.request("GET", f"/balance{postfix}", weight=5)
+        raw_result = self._call("balance", options)
         # Convert to desired format
         return self._convert_raw_result(raw_result, "balance", model, schema)
 
@@ -144,15 +191,16 @@ class PrivateAPI(BaseAPI):
             Order placement result
         """
         effective_model, effective_schema = self._get_effective_model("order", model, schema)
-        payload = {
+        payload: dict[str, Any] = {
             "market": market,
             "side": side,
             "orderType": order_type,
             "operatorId": operator_id,
             "responseRequired": response_required,
-            **body,
         }
-        return self.http.request("POST", "/order", body=payload, weight=1)
+        # Values in `body` win over the defaults above; the caller's dict is left untouched
+        payload.update(body)
+        return self._call("place_order", body=payload)
 
     def get_order(
         self,
@@ -175,7 +223,7 @@ class PrivateAPI(BaseAPI):
         # Get raw data from API
         raw_result = self.http.request(
             "GET",
-            f"/{market}/order",
+            "/" + market + "/order",
             body={"orderId": order_id},
             weight=1,
         )
@@ -257,7 +305,7 @@ class PrivateAPI(BaseAPI):
             response_required=response_required,
         )
 
-        return self.http.request("PUT", "/order", body=payload, weight=1)
+        return self._call("update_order", body=payload)
 
     def _build_update_order_payload(
         self,
@@ -277,7 +325,7 @@ class PrivateAPI(BaseAPI):
         response_required: bool | None,
     ) -> dict[str, Any]:
         """Build the payload for update order request."""
-        payload = {
+        payload: dict[str, Any] = {
             "market": market,
             "operatorId": operator_id,
         }
@@ -292,17 +340,17 @@ class PrivateAPI(BaseAPI):
         payload.update(
             {
                 key: value
-                for key, value in {
-                    "amount": amount,
-                    "amountQuote": amount_quote,
-                    "amountRemaining": amount_remaining,
-                    "price": price,
-                    "triggerAmount": trigger_amount,
-                    "timeInForce": time_in_force,
-                    "selfTradePrevention": self_trade_prevention,
-                    "postOnly": post_only,
-                    "responseRequired": response_required,
-                }.items()
+                for key, value in (
+                    ("amount", amount),
+                    ("amountQuote", amount_quote),
+                    ("amountRemaining", amount_remaining),
+                    ("price", price),
+                    ("triggerAmount", trigger_amount),
+                    ("timeInForce", time_in_force),
+                    ("selfTradePrevention", self_trade_prevention),
+                    ("postOnly", post_only),
+                    ("responseRequired", response_required),
+                )
                 if value is not None
             }
         )
@@ -351,15 +399,8 @@ class PrivateAPI(BaseAPI):
         elif order_id:
             params["orderId"] = order_id
 
-        # Create query string
-        postfix = create_postfix(params)
-
         effective_model, effective_schema = self._get_effective_model("cancel_order", model, schema)
-        return self.http.request(
-            "DELETE",
-            f"/order{postfix}",
-            weight=1,
-        )
+        return self._call("cancel_order", params)
 
     def get_orders(
         self,
@@ -416,10 +457,9 @@ class PrivateAPI(BaseAPI):
         effective_model, effective_schema = self._get_effective_model("orders", model, schema)
         options = default(options, {})
         options["market"] = market
-        postfix = create_postfix(options)
 
         # Get raw data first
-        raw_result = self.http.request("GET", f"/orders{postfix}", weight=5)
+        raw_result = self._call("orders", options)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "orders", effective_model, effective_schema)
@@ -457,8 +497,7 @@ class PrivateAPI(BaseAPI):
         if market is not None:
             params["market"] = market
 
-        postfix = create_postfix(params)
-        return self.http.request("DELETE", f"/orders{postfix}", weight=1)
+        return self._call("cancel_orders", params)
 
     def orders_open(
         self,
@@ -481,13 +520,12 @@ class PrivateAPI(BaseAPI):
         Rate limit: 25 points (without market), 1 point (with market)
         """
         effective_model, effective_schema = self._get_effective_model("orders", model, schema)
-        postfix = create_postfix(options)
 
         # Rate limit is 1 point with market parameter, 25 points without
-        weight = 1 if options and "market" in options else 25
+        weight = 1 if options and "market" in options else None
 
         # Get raw data first
-        raw_result = self.http.request("GET", f"/ordersOpen{postfix}", weight=weight)
+        raw_result = self._call("orders_open", options, weight=weight)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "orders", effective_model, effective_schema)
@@ -542,10 +580,9 @@ class PrivateAPI(BaseAPI):
                 raise ValueError(msg)
 
         effective_model, effective_schema = self._get_effective_model("fees", model, schema)
-        postfix = create_postfix(options)
 
         # Get raw data first
-        raw_result = self.http.request("GET", f"/account/fees{postfix}", weight=1)
+        raw_result = self._call("fees", options)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "fees", effective_model, effective_schema)
@@ -581,15 +618,8 @@ class PrivateAPI(BaseAPI):
             msg = "DataFrame model is not supported due to the shape of data"
             return Failure(TypeError(msg))
 
-        params = {"symbol": symbol}
-        postfix = create_postfix(params)
-
         # Get raw data first
-        raw_result = self.http.request(
-            "GET",
-            f"/deposit{postfix}",
-            weight=1,
-        )
+        raw_result = self._call("deposit", {"symbol": symbol})
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "deposit", effective_model, effective_schema)
@@ -613,10 +643,9 @@ class PrivateAPI(BaseAPI):
             Result containing deposits data or error
         """
         effective_model, effective_schema = self._get_effective_model("deposit_history", model, schema)
-        postfix = create_postfix(options)
 
         # Get raw data first
-        raw_result = self.http.request("GET", f"/depositHistory{postfix}", weight=5)
+        raw_result = self._call("deposit_history", options)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "deposit_history", effective_model, effective_schema)
@@ -638,10 +667,9 @@ class PrivateAPI(BaseAPI):
             Result containing withdrawals data or error
         """
         effective_model, effective_schema = self._get_effective_model("withdrawals", model, schema)
-        postfix = create_postfix(options)
 
         # Get raw data first
-        raw_result = self.http.request("GET", f"/withdrawalHistory{postfix}", weight=1)
+        raw_result = self._call("withdrawals", options)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "withdrawals", effective_model, effective_schema)
@@ -730,10 +758,8 @@ class PrivateAPI(BaseAPI):
             - feesCurrency/feesAmount: Fee information (optional for staking)
             - address: Transaction address (nullable)
         """
-        postfix = create_postfix(options)
-
         # Get raw data first
-        raw_result = self.http.request("GET", f"/account/history{postfix}", weight=1)
+        raw_result = self._call("transaction_history", options)
 
         # Always split the response into items and metadata for all model types
         match raw_result:
@@ -858,10 +884,8 @@ class PrivateAPI(BaseAPI):
         query_options = default(options, {})
         query_options["market"] = market
 
-        postfix = create_postfix(query_options)
-
         # Get raw data first
-        raw_result = self.http.request("GET", f"/trades{postfix}", weight=5)
+        raw_result = self._call("trade_history", query_options)
 
         # Convert using the shared method
         return self._convert_raw_result(raw_result, "trade_history", effective_model, effective_schema)
@@ -891,5 +915,5 @@ class PrivateAPI(BaseAPI):
         body = {"symbol": symbol, "amount": amount, "address": address}
         if options:
             body.update(options)
-        raw_result = self.http.request("POST", "/withdrawal", body=body, weight=1)
+        raw_result = self._call("withdraw", body=body)
         return self._convert_raw_result(raw_result, "withdraw", model, schema)
@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeVar
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any, ClassVar, Final, Literal, TypeVar
+
+from returns.result import Success
 
-from bitvavo_client.core import public_models
 from bitvavo_client.endpoints.base import BaseAPI
 from bitvavo_client.endpoints.common import create_postfix
 from bitvavo_client.schemas.public_schemas import DEFAULT_SCHEMAS
@@ -21,8 +24,13 @@ MAX_TIMESTAMP_VALUE = 8640000000000000  # Maximum allowed timestamp value
 MAX_BOOK_DEPTH = 1000  # Maximum depth for order book
 MAX_BOOK_REPORT_DEPTH = 1000  # Maximum depth for order book report
 
+# Rate limit weights according to Bitvavo documentation
+WEIGHT_DEFAULT: Final = 1
+WEIGHT_TRADES: Final = 5  # trades and trades report
+WEIGHT_TICKER_24H: Final = 25
+
 if TYPE_CHECKING:  # pragma: no cover
-    from collections.abc import Mapping
+    from collections.abc import Callable, Mapping
 
     import httpx
     from returns.result import Result
@@ -30,7 +38,7 @@ if TYPE_CHECKING:  # pragma: no cover
     from bitvavo_client.adapters.returns_adapter import BitvavoError
     from bitvavo_client.core.model_preferences import ModelPreference
     from bitvavo_client.core.types import AnyDict
-    from bitvavo_client.transport.http import HTTPClient
+    from bitvavo_client.transport.http import AsyncHTTPClient, HTTPClient
 
 T = TypeVar("T")
 
@@ -38,18 +46,22 @@ T = TypeVar("T")
 class PublicAPI(BaseAPI):
     """Handles all public Bitvavo API endpoints."""
 
-    _endpoint_models: ClassVar[dict[str, type[Any]]] = {
-        "time": public_models.ServerTime,
-        "markets": public_models.Markets,
-        "assets": public_models.Assets,
-        "book": public_models.OrderBook,
-        "trades": public_models.Trades,
-        "candles": public_models.Candles,
-        "ticker_price": public_models.TickerPrices,
-        "ticker_book": public_models.TickerBooks,
-        "ticker_24h": public_models.Ticker24hs,
-        "report_book": public_models.OrderBookReport,
-        "report_trades": public_models.TradesReport,
+    __slots__ = ("_cache", "_cache_ttl")
+
+    # Model class names in `bitvavo_client.core.public_models`; the module is only imported for pydantic output
+    _models_module = "bitvavo_client.core.public_models"
+    _endpoint_models: ClassVar[dict[str, str]] = {
+        "time": "ServerTime",
+        "markets": "Markets",
+        "assets": "Assets",
+        "book": "OrderBook",
+        "trades": "Trades",
+        "candles": "Candles",
+        "ticker_price": "TickerPrices",
+        "ticker_book": "TickerBooks",
+        "ticker_24h": "Ticker24hs",
+        "report_book": "OrderBookReport",
+        "report_trades": "TradesReport",
     }
 
     _default_schemas = DEFAULT_SCHEMAS
@@ -60,15 +72,45 @@ class PublicAPI(BaseAPI):
         *,
         preferred_model: ModelPreference | str | None = None,
         default_schema: Mapping[str, object] | None = None,
+        cache_ttl: float = 0.0,
     ) -> None:
-        """Initialize public API handler."""
+        """Initialize public API handler.
+
+        Args:
+            http_client: HTTP client used for the requests
+            preferred_model: Preferred model format for responses
+            default_schema: Default schema for DataFrame conversion
+            cache_ttl: Seconds to reuse successful `markets()` and `assets()` responses for; 0 disables caching
+        """
         super().__init__(http_client, preferred_model=preferred_model, default_schema=default_schema)
+        self._cache_ttl = cache_ttl
+        # request path -> (expiry on the monotonic clock, raw result)
+        self._cache: dict[str, tuple[float, Result[Any, BitvavoError | httpx.HTTPError]]] = {}
+
+    def _get_cached(self, path: str) -> Result[Any, BitvavoError | httpx.HTTPError]:
+        """GET `path`, reusing a successful response for `cache_ttl` seconds.
+
+        Only the raw response is cached, so model conversion still happens per call. Cached data is shared between
+        calls with the RAW model preference, so don't mutate it.
+        """
+        if not self._cache_ttl:
+            return self.http.request("GET", path, weight=WEIGHT_DEFAULT)
+
+        now = time.monotonic()
+        hit = self._cache.get(path)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+
+        raw_result = self.http.request("GET", path, weight=WEIGHT_DEFAULT)
+        if isinstance(raw_result, Success):
+            self._cache[path] = (now + self._cache_ttl, raw_result)
+        return raw_result
 
     def time(
         self,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get server time.
 
@@ -79,9 +121,8 @@ class PublicAPI(BaseAPI):
         Returns:
             Result containing server time or error
         """
-        # Get raw data from API
-        raw_result = self.http.request("GET", "/time", weight=1)
-        # Convert to desired format
+        path, weight = _public_request("time")
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "time", model, schema)
 
     def markets(
@@ -89,7 +130,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get market information.
 
@@ -101,10 +142,8 @@ class PublicAPI(BaseAPI):
         Returns:
             Result containing market information or error
         """
-        # Get raw data from API
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/markets{postfix}", weight=1)
-        # Convert to desired format
+        path, _ = _public_request("markets", options)
+        raw_result = self._get_cached(path)
         return self._convert_raw_result(raw_result, "markets", model, schema)
 
     def assets(
@@ -112,7 +151,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get asset information.
 
@@ -151,8 +190,8 @@ class PublicAPI(BaseAPI):
             This is a public endpoint but authenticating gives higher rate limits.
             Status values can be: "OK", "MAINTENANCE", "DELISTED".
         """
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/assets{postfix}", weight=1)
+        path, _ = _public_request("assets", options)
+        raw_result = self._get_cached(path)
         return self._convert_raw_result(raw_result, "assets", model, schema)
 
     def book(
@@ -161,7 +200,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get order book for a market.
 
@@ -191,15 +230,8 @@ class PublicAPI(BaseAPI):
         Note:
             This is a public endpoint but authenticating gives higher rate limits.
         """
-        # Validate depth parameter if provided
-        if options and "depth" in options:
-            depth = options["depth"]
-            if not isinstance(depth, int) or not (1 <= depth <= MAX_BOOK_DEPTH):
-                msg = f"depth must be an integer between 1 and {MAX_BOOK_DEPTH} (inclusive)"
-                raise ValueError(msg)
-
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/{market}/book{postfix}", weight=1)
+        path, weight = _public_request("book", options, market)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "book", model, schema)
 
     def trades(
@@ -208,7 +240,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get public trades for a market.
 
@@ -238,12 +270,8 @@ class PublicAPI(BaseAPI):
             >>> client.public.trades("BTC-EUR", {"limit": 100})
             >>> client.public.trades("BTC-EUR", {"start": 1577836800000, "end": 1577836900000})
         """
-        # Validate options if provided
-        if options:
-            self._validate_trades_options(options)
-
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/{market}/trades{postfix}", weight=5)
+        path, weight = _public_request("trades", options, market)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "trades", model, schema)
 
     def candles(
@@ -253,7 +281,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get candlestick data for a market.
 
@@ -270,37 +298,8 @@ class PublicAPI(BaseAPI):
         Raises:
             ValueError: If interval is invalid or limit is not in range 1-1440 or timestamps are invalid
         """
-        # Validate interval parameter at runtime
-        valid_intervals = {"1m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "1W", "1M"}
-        if interval not in valid_intervals:
-            msg = f"interval must be one of: {', '.join(sorted(valid_intervals))}"
-            raise ValueError(msg)
-
-        if options is None:
-            options = {}
-
-        # Validate optional parameters according to Bitvavo API documentation
-        if "limit" in options:
-            limit = options["limit"]
-            if not isinstance(limit, int) or not (1 <= limit <= MAX_CANDLE_LIMIT):
-                msg = f"limit must be an integer between 1 and {MAX_CANDLE_LIMIT} (inclusive)"
-                raise ValueError(msg)
-
-        if "start" in options:
-            start = options["start"]
-            if not isinstance(start, int) or start < 0:
-                msg = "start must be a non-negative unix timestamp in milliseconds"
-                raise ValueError(msg)
-
-        if "end" in options:
-            end = options["end"]
-            if not isinstance(end, int) or end < 0 or end > MAX_TIMESTAMP_VALUE:
-                msg = f"end must be a unix timestamp in milliseconds <= {MAX_TIMESTAMP_VALUE}"
-                raise ValueError(msg)
-
-        options["interval"] = interval
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/{market}/candles{postfix}", weight=1)
+        path, weight = _public_request("candles", _candles_options(interval, options), market)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "candles", model, schema)
 
     def ticker_price(
@@ -308,7 +307,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get ticker prices for markets.
 
@@ -338,15 +337,8 @@ class PublicAPI(BaseAPI):
         Note:
             This is a public endpoint but authenticating gives higher rate limits.
         """
-        # Validate market parameter if provided
-        if options and "market" in options:
-            market = options["market"]
-            if not isinstance(market, str) or not market.strip():
-                msg = "market must be a non-empty string"
-                raise ValueError(msg)
-
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/ticker/price{postfix}", weight=1)
+        path, weight = _public_request("ticker_price", options)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "ticker_price", model, schema)
 
     def ticker_book(
@@ -354,7 +346,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get ticker book.
 
@@ -366,8 +358,8 @@ class PublicAPI(BaseAPI):
         Returns:
             Result containing ticker book data or error
         """
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/ticker/book{postfix}", weight=1)
+        path, weight = _public_request("ticker_book", options)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "ticker_book", model, schema)
 
     def ticker_24h(
@@ -375,7 +367,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get 24h ticker statistics.
 
@@ -390,12 +382,8 @@ class PublicAPI(BaseAPI):
         Returns:
             Result containing 24h ticker statistics or error
         """
-        if options and "market" in options:
-            msg = "Market parameter is not allowed for 24h ticker statistics; yes, the API supports it, but I don't"
-            raise ValueError(msg)
-
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/ticker/24h{postfix}", weight=25)
+        path, weight = _public_request("ticker_24h", options)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "ticker_24h", model, schema)
 
     def report_book(
@@ -404,7 +392,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get MiCA-compliant order book report for a market.
 
@@ -457,15 +445,8 @@ class PublicAPI(BaseAPI):
             The response structure is different from the regular order book endpoint
             and includes additional MiCA compliance fields.
         """
-        # Validate depth parameter if provided
-        if options and "depth" in options:
-            depth = options["depth"]
-            if not isinstance(depth, int) or not (1 <= depth <= MAX_BOOK_REPORT_DEPTH):
-                msg = f"depth must be an integer between 1 and {MAX_BOOK_REPORT_DEPTH} (inclusive)"
-                raise ValueError(msg)
-
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/report/{market}/book{postfix}", weight=1)
+        path, weight = _public_request("report_book", options, market)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "report_book", model, schema)
 
     def report_trades(
@@ -474,7 +455,7 @@ class PublicAPI(BaseAPI):
         options: AnyDict | None = None,
         *,
         model: type[T] | Any | None = None,
-        schema: dict | None = None,
+        schema: dict[str, Any] | None = None,
     ) -> Result[T, BitvavoError | httpx.HTTPError]:
         """Get MiCA-compliant trades report for a market.
 
@@ -517,35 +498,302 @@ class PublicAPI(BaseAPI):
             >>> client.public.report_trades("BTC-EUR", {"limit": 100})
             Success([...])
         """
-        postfix = create_postfix(options)
-        raw_result = self.http.request("GET", f"/report/{market}/trades{postfix}", weight=5)
+        path, weight = _public_request("report_trades", options, market)
+        raw_result = self.http.request("GET", path, weight=weight)
         return self._convert_raw_result(raw_result, "report_trades", model, schema)
 
-    def _validate_trades_options(self, options: AnyDict) -> None:
-        """Validate options for the trades endpoint according to Bitvavo API documentation.
 
-        Args:
-            options: Dictionary of query parameters to validate
+class AsyncPublicAPI(BaseAPI):
+    """Async versions of the `PublicAPI` endpoints.
 
-        Raises:
-            ValueError: If any parameter violates Bitvavo's constraints
-        """
-        if "limit" in options:
-            limit = options["limit"]
-            if not isinstance(limit, int) or limit < 1 or limit > MAX_TRADES_LIMIT:
-                msg = f"limit must be an integer between 1 and {MAX_TRADES_LIMIT}"
-                raise ValueError(msg)
-
-        if "start" in options and "end" in options:
-            start = options["start"]
-            end = options["end"]
-            # Check 24-hour constraint combined with type check
-            if isinstance(start, int) and isinstance(end, int) and end - start > MAX_24_HOUR_MS:
-                msg = "end timestamp cannot be more than 24 hours after start timestamp"
-                raise ValueError(msg)
-
-        if "end" in options:
-            end = options["end"]
-            if isinstance(end, int) and end > MAX_END_TIMESTAMP:
-                msg = f"end timestamp cannot exceed {MAX_END_TIMESTAMP}"
-                raise ValueError(msg)
+    Validation, rate limit weights and model conversion are the same as for `PublicAPI`; see its methods for the
+    details of each endpoint. Use `asyncio.gather` to run several requests concurrently.
+    """
+
+    __slots__ = ()
+
+    _models_module = PublicAPI._models_module  # noqa: SLF001
+    _endpoint_models = PublicAPI._endpoint_models  # noqa: SLF001
+    _default_schemas = DEFAULT_SCHEMAS
+
+    http: AsyncHTTPClient  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        http_client: AsyncHTTPClient,
+        *,
+        preferred_model: ModelPreference | str | None = None,
+        default_schema: Mapping[str, object] | None = None,
+    ) -> None:
+        """Initialize async public API handler."""
+        super().__init__(http_client, preferred_model=preferred_model, default_schema=default_schema)  # type: ignore[arg-type]
+
+    async def time(
+        self,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get server time. See `PublicAPI.time`."""
+        path, weight = _public_request("time")
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "time", model, schema)
+
+    async def markets(
+        self,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get market information. See `PublicAPI.markets`."""
+        path, weight = _public_request("markets", options)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "markets", model, schema)
+
+    async def assets(
+        self,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get asset information. See `PublicAPI.assets`."""
+        path, weight = _public_request("assets", options)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "assets", model, schema)
+
+    async def book(
+        self,
+        market: str,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get order book for a market. See `PublicAPI.book`."""
+        path, weight = _public_request("book", options, market)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "book", model, schema)
+
+    async def trades(
+        self,
+        market: str,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get public trades for a market. See `PublicAPI.trades`."""
+        path, weight = _public_request("trades", options, market)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "trades", model, schema)
+
+    async def candles(
+        self,
+        market: str,
+        interval: CandleInterval,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get candlestick data for a market. See `PublicAPI.candles`."""
+        path, weight = _public_request("candles", _candles_options(interval, options), market)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "candles", model, schema)
+
+    async def ticker_price(
+        self,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get ticker prices for markets. See `PublicAPI.ticker_price`."""
+        path, weight = _public_request("ticker_price", options)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "ticker_price", model, schema)
+
+    async def ticker_book(
+        self,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get ticker book. See `PublicAPI.ticker_book`."""
+        path, weight = _public_request("ticker_book", options)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "ticker_book", model, schema)
+
+    async def ticker_24h(
+        self,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get 24h ticker statistics. See `PublicAPI.ticker_24h`."""
+        path, weight = _public_request("ticker_24h", options)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "ticker_24h", model, schema)
+
+    async def report_book(
+        self,
+        market: str,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get MiCA-compliant order book report for a market. See `PublicAPI.report_book`."""
+        path, weight = _public_request("report_book", options, market)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "report_book", model, schema)
+
+    async def report_trades(
+        self,
+        market: str,
+        options: AnyDict | None = None,
+        *,
+        model: type[T] | Any | None = None,
+        schema: dict[str, Any] | None = None,
+    ) -> Result[T, BitvavoError | httpx.HTTPError]:
+        """Get MiCA-compliant trades report for a market. See `PublicAPI.report_trades`."""
+        path, weight = _public_request("report_trades", options, market)
+        raw_result = await self.http.request("GET", path, weight=weight)
+        return self._convert_raw_result(raw_result, "report_trades", model, schema)
+
+
+def _validate_depth(options: AnyDict | None, max_depth: int) -> None:
+    """Validate the optional depth parameter of the (report) book endpoints."""
+    if options and "depth" in options:
+        depth = options["depth"]
+        if not isinstance(depth, int) or not (1 <= depth <= max_depth):
+            msg = f"depth must be an integer between 1 and {max_depth} (inclusive)"
+            raise ValueError(msg)
+
+
+def _validate_trades_options(options: AnyDict | None) -> None:
+    """Validate options for the trades endpoint according to Bitvavo API documentation.
+
+    Args:
+        options: Dictionary of query parameters to validate
+
+    Raises:
+        ValueError: If any parameter violates Bitvavo's constraints
+    """
+    if not options:
+        return
+
+    if "limit" in options:
+        limit = options["limit"]
+        if not isinstance(limit, int) or limit < 1 or limit > MAX_TRADES_LIMIT:
+            msg = f"limit must be an integer between 1 and {MAX_TRADES_LIMIT}"
+            raise ValueError(msg)
+
+    if "start" in options and "end" in options:
+        start = options["start"]
+        end = options["end"]
+        # Check 24-hour constraint combined with type check
+        if isinstance(start, int) and isinstance(end, int) and end - start > MAX_24_HOUR_MS:
+            msg = "end timestamp cannot be more than 24 hours after start timestamp"
+            raise ValueError(msg)
+
+    if "end" in options:
+        end = options["end"]
+        if isinstance(end, int) and end > MAX_END_TIMESTAMP:
+            msg = f"end timestamp cannot exceed {MAX_END_TIMESTAMP}"
+            raise ValueError(msg)
+
+
+def _candles_options(interval: CandleInterval, options: AnyDict | None) -> AnyDict:
+    """Validate the candles parameters and return the query options, including the interval."""
+    # Validate interval parameter at runtime
+    valid_intervals = {"1m", "5m", "15m", "30m", "1h", "2h", "4h", "6h", "8h", "12h", "1d", "1W", "1M"}
+    if interval not in valid_intervals:
+        msg = f"interval must be one of: {', '.join(sorted(valid_intervals))}"
+        raise ValueError(msg)
+
+    if options is None:
+        options = {}
+
+    # Validate optional parameters according to Bitvavo API documentation
+    if "limit" in options:
+        limit = options["limit"]
+        if not isinstance(limit, int) or not (1 <= limit <= MAX_CANDLE_LIMIT):
+            msg = f"limit must be an integer between 1 and {MAX_CANDLE_LIMIT} (inclusive)"
+            raise ValueError(msg)
+
+    if "start" in options:
+        start = options["start"]
+        if not isinstance(start, int) or start < 0:
+            msg = "start must be a non-negative unix timestamp in milliseconds"
+            raise ValueError(msg)
+
+    if "end" in options:
+        end = options["end"]
+        if not isinstance(end, int) or end < 0 or end > MAX_TIMESTAMP_VALUE:
+            msg = f"end must be a unix timestamp in milliseconds <= {MAX_TIMESTAMP_VALUE}"
+            raise ValueError(msg)
+
+    options["interval"] = interval
+    return options
+
+
+def _validate_ticker_price_options(options: AnyDict | None) -> None:
+    """Validate the optional market parameter of the ticker price endpoint."""
+    if options and "market" in options:
+        market = options["market"]
+        if not isinstance(market, str) or not market.strip():
+            msg = "market must be a non-empty string"
+            raise ValueError(msg)
+
+
+def _validate_ticker_24h_options(options: AnyDict | None) -> None:
+    """Validate the options of the 24h ticker endpoint."""
+    if options and "market" in options:
+        msg = "Market parameter is not allowed for 24h ticker statistics; yes, the API supports it, but I don't"
+        raise ValueError(msg)
+
+
+# (path, rate limit weight) per endpoint; `{market}` in a path is filled in with the requested market
+_ROUTES: Final[Mapping[str, tuple[str, int]]] = {
+    "time": ("/time", WEIGHT_DEFAULT),
+    "markets": ("/markets", WEIGHT_DEFAULT),
+    "assets": ("/assets", WEIGHT_DEFAULT),
+    "book": ("/{market}/book", WEIGHT_DEFAULT),
+    "trades": ("/{market}/trades", WEIGHT_TRADES),
+    "candles": ("/{market}/candles", WEIGHT_DEFAULT),
+    "ticker_price": ("/ticker/price", WEIGHT_DEFAULT),
+    "ticker_book": ("/ticker/book", WEIGHT_DEFAULT),
+    "ticker_24h": ("/ticker/24h", WEIGHT_TICKER_24H),
+    "report_book": ("/report/{market}/book", WEIGHT_DEFAULT),
+    "report_trades": ("/report/{market}/trades", WEIGHT_TRADES),
+}
+
+# Option checks per endpoint; candles are validated by `_candles_options`, which also adds the interval
+_VALIDATORS: Final[Mapping[str, Callable[[AnyDict | None], None]]] = {
+    "book": partial(_validate_depth, max_depth=MAX_BOOK_DEPTH),
+    "trades": _validate_trades_options,
+    "ticker_price": _validate_ticker_price_options,
+    "ticker_24h": _validate_ticker_24h_options,
+    "report_book": partial(_validate_depth, max_depth=MAX_BOOK_REPORT_DEPTH),
+}
+
+
+def _public_request(endpoint: str, options: AnyDict | None = None, market: str = "") -> tuple[str, int]:
+    """Validate `options` for a public endpoint and return its request path and rate limit weight.
+
+    Shared by `PublicAPI` and `AsyncPublicAPI`, so the two only differ in how the request is sent.
+
+    Raises:
+        ValueError: If `options` violates the endpoint's constraints
+    """
+    validate = _VALIDATORS.get(endpoint)
+    if validate is not None:
+        validate(options)
+    path, weight = _ROUTES[endpoint]
+    path = path.format(market=market)
+    return (path + create_postfix(options) if options else path), weight
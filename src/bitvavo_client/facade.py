@@ -2,18 +2,35 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+import warnings
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 from bitvavo_client.auth.rate_limit import RateLimitManager
-from bitvavo_client.core.settings import BitvavoSettings
+from bitvavo_client.core.settings import BitvavoSettings, get_core_settings
 from bitvavo_client.endpoints.private import PrivateAPI
-from bitvavo_client.endpoints.public import PublicAPI
-from bitvavo_client.transport.http import HTTPClient
+from bitvavo_client.endpoints.public import AsyncPublicAPI, PublicAPI
+from bitvavo_client.transport.http import AsyncHTTPClient, HTTPClient
 
 if TYPE_CHECKING:  # pragma: no cover
+    from types import TracebackType
+
+    import httpx
+    from returns.result import Result
+    from typing_extensions import Self
+
+    from bitvavo_client.adapters.returns_adapter import BitvavoError
     from bitvavo_client.core.model_preferences import ModelPreference
 
 
+class MarketSnapshot(NamedTuple):
+    """Results of the public requests made by `BitvavoClient.snapshot()`."""
+
+    markets: Result[Any, BitvavoError | httpx.HTTPError]
+    assets: Result[Any, BitvavoError | httpx.HTTPError]
+    ticker_24h: Result[Any, BitvavoError | httpx.HTTPError]
+
+
 class BitvavoClient:
     """
     Main Bitvavo API client facade providing backward-compatible interface.
@@ -32,25 +49,126 @@ class BitvavoClient:
         """Initialize Bitvavo client.
 
         Args:
-            settings: Optional settings override. If None, uses defaults.
+            settings: Optional settings override. If None, uses the shared `get_core_settings()`.
             preferred_model: Preferred model format for responses
             default_schema: Default schema for DataFrame conversion
         """
-        self.settings = settings or BitvavoSettings()
+        self.settings = settings or get_core_settings()
         self.rate_limiter = RateLimitManager(
             default_remaining=self.settings.default_rate_limit,
             buffer=self.settings.rate_limit_buffer,
         )
         self.http = HTTPClient(self.settings, self.rate_limiter)
+        self._preferred_model = preferred_model
+        self._default_schema = default_schema
+        # Built on first use, so sync-only clients don't open an httpx.AsyncClient
+        self._http_async: AsyncHTTPClient | None = None
+        self._public_async: AsyncPublicAPI | None = None
 
         # Initialize API endpoint handlers with preferred model settings
         self.public = PublicAPI(
             self.http,
             preferred_model=preferred_model,
             default_schema=default_schema,
+            cache_ttl=self.settings.public_cache_ttl_s,
         )
         self.private = PrivateAPI(
             self.http,
             preferred_model=preferred_model,
             default_schema=default_schema,
         )
+
+    @property
+    def http_async(self) -> AsyncHTTPClient:
+        """The async HTTP client, sharing this client's settings and rate limiter. Created on first access."""
+        if self._http_async is None:
+            self._http_async = AsyncHTTPClient(self.settings, self.rate_limiter)
+        return self._http_async
+
+    @property
+    def public_async(self) -> AsyncPublicAPI:
+        """The async public API, backed by `http_async`. Created on first access."""
+        if self._public_async is None:
+            self._public_async = AsyncPublicAPI(
+                self.http_async,
+                preferred_model=self._preferred_model,
+                default_schema=self._default_schema,
+            )
+        return self._public_async
+
+    async def snapshot(self) -> MarketSnapshot:
+        """Fetch markets, assets and 24h tickers concurrently.
+
+        The three requests run together on the async client, so they share its pooled connection (multiplexed when
+        HTTP/2 is available) instead of being made one after another. Responses are converted like the matching
+        `public_async` methods.
+
+        Returns:
+            MarketSnapshot with one Result per endpoint
+        """
+        markets: Result[Any, BitvavoError | httpx.HTTPError]
+        assets: Result[Any, BitvavoError | httpx.HTTPError]
+        ticker_24h: Result[Any, BitvavoError | httpx.HTTPError]
+        markets, assets, ticker_24h = await asyncio.gather(
+            self.public_async.markets(),
+            self.public_async.assets(),
+            self.public_async.ticker_24h(),
+        )
+        return MarketSnapshot(markets, assets, ticker_24h)
+
+    def close(self) -> None:
+        """Close the HTTP connections held by the sync client, and by the async client if it was used.
+
+        The async client can't be closed from inside a running event loop; a `ResourceWarning` is emitted instead and
+        it stays open. Use `await client.aclose()` or `async with BitvavoClient() as client` there.
+        """
+        self.http.close()
+        if self._http_async is None:
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            warnings.warn(
+                "close() can't close the async client inside a running event loop; use `await client.aclose()` or "
+                "`async with BitvavoClient() as client`",
+                ResourceWarning,
+                stacklevel=2,
+            )
+            return
+        try:
+            asyncio.run(self._http_async.aclose())
+        except RuntimeError as exc:
+            # Connections opened in an `asyncio.run()` that has since finished belong to that closed loop and can't be
+            # shut down anymore; httpx has already marked the client closed, so only that case is ignored
+            if str(exc) != "Event loop is closed":
+                raise
+
+    async def aclose(self) -> None:
+        """Close the HTTP connections held by both the sync and the async client."""
+        self.http.close()
+        if self._http_async is not None:
+            await self._http_async.aclose()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
 import time
-from typing import TYPE_CHECKING, Any
+from functools import lru_cache
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Final
 
 import httpx
 from returns.result import Failure, Result
@@ -13,17 +17,128 @@ from bitvavo_client.adapters.returns_adapter import (
     BitvavoError,
     decode_response_result,
 )
-from bitvavo_client.auth.signing import create_signature
+from bitvavo_client.auth.signing import create_signer, encode_body
 
 if TYPE_CHECKING:  # pragma: no cover
+    import ssl
+    from types import TracebackType
+
+    from typing_extensions import Self
+
     from bitvavo_client.auth.rate_limit import RateLimitManager
-    from bitvavo_client.core.settings import BitvavoSettings
+    from bitvavo_client.auth.signing import Signer
+    from bitvavo_client.core.settings import ApiKey, BitvavoSettings
     from bitvavo_client.core.types import AnyDict
 
 logger = get_logger(__name__)
 
+# HTTP/2 needs the optional `h2` package (`pip install httpx[http2]`); fall back to HTTP/1.1 keep-alive without it
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+# Supported HTTP methods, and whether their request body is sent as JSON
+_SENDS_JSON_BODY: Final = {"GET": False, "DELETE": False, "POST": True, "PUT": True}
+
+
+@lru_cache(maxsize=4)
+def _cached_ssl_context(cert_file: str | None, cert_dir: str | None) -> ssl.SSLContext:  # noqa: ARG001
+    """Build httpx's default TLS context; the arguments are the CA locations it reads, so they key the cache."""
+    return httpx.create_ssl_context()
+
+
+def _ssl_context() -> ssl.SSLContext:
+    """Return the TLS context shared by the pooled clients.
+
+    Loading the CA bundle is most of the cost of creating an httpx client, and every `BitvavoClient` creates two, so
+    the context is built once per CA location (`SSL_CERT_FILE` / `SSL_CERT_DIR`, as read by httpx).
+    """
+    return _cached_ssl_context(os.environ.get("SSL_CERT_FILE"), os.environ.get("SSL_CERT_DIR"))
+
+
+def _sent_content(method: str, headers: dict[str, str], content: bytes) -> bytes | None:
+    """Return the encoded body to send for `method`, if any, and set its content type in `headers`."""
+    if not content or not _SENDS_JSON_BODY.get(method):
+        return None
+    headers["content-type"] = "application/json"
+    return content
+
+
+class _HTTPClientBase:
+    """Request signing and rate limit bookkeeping shared by the sync and async HTTP clients."""
+
+    settings: BitvavoSettings
+    rate_limiter: RateLimitManager
+    api_key: str
+    api_secret: str
+    _base_headers: dict[str, str]
+    _sign: Signer
+
+    @staticmethod
+    def _check_method(method: str) -> None:
+        """Raise if `method` isn't a supported HTTP method, before anything is signed, recorded or sent."""
+        if method not in _SENDS_JSON_BODY:
+            msg = f"Unsupported HTTP method: {method}"
+            logger.error("unsupported-http-method", method=method)
+            raise ValueError(msg)
+
+    def _create_auth_headers(self, method: str, endpoint: str, content: bytes) -> dict[str, str]:
+        """Create authentication headers if API key is configured.
 
-class HTTPClient:
+        `content` is the body as encoded by `encode_body`, so the signature covers exactly the bytes that are sent.
+        """
+        timestamp = time.time_ns() // 1_000_000 + self.settings.lag_ms
+        headers = self._base_headers.copy()
+        headers["bitvavo-access-signature"] = self._sign(timestamp, method, endpoint, content)
+        headers["bitvavo-access-timestamp"] = str(timestamp)
+        return headers
+
+    def _cache_key_state(self) -> None:
+        """Cache the auth headers and HMAC key that stay the same for every request made with the current key."""
+        self._sign = create_signer(self.api_secret)
+        self._base_headers = {
+            "bitvavo-access-key": self.api_key,
+            "bitvavo-access-window": str(self.settings.access_window_ms),
+        }
+
+    def _update_rate_limits(self, response: httpx.Response, idx: int) -> None:
+        """Update rate limits based on response."""
+        # Only error responses carry an error payload. Successful bodies (which can be large) are decoded just once,
+        # by decode_response_result.
+        json_data: Any = {}
+        if not response.is_success:
+            try:
+                json_data = response.json()
+            except ValueError:
+                json_data = {}
+
+        if isinstance(json_data, dict) and "error" in json_data:
+            if self._is_rate_limit_error(response, json_data):
+                logger.warning("rate-limit-error-detected", key_index=idx)
+                self.rate_limiter.update_from_error(idx, json_data)
+            else:
+                logger.debug("non-rate-limit-error", key_index=idx)
+                self.rate_limiter.update_from_headers(idx, response.headers)
+        else:
+            logger.debug("successful-response", key_index=idx)
+            self.rate_limiter.update_from_headers(idx, response.headers)
+
+    def _is_rate_limit_error(self, response: httpx.Response, json_data: dict[str, Any]) -> bool:
+        """Check if response indicates a rate limit error."""
+        status = getattr(response, "status_code", None)
+        if status == httpx.codes.TOO_MANY_REQUESTS:
+            return True
+
+        err = json_data.get("error")
+        if isinstance(err, dict):
+            code = str(err.get("code", "")).lower()
+            message = str(err.get("message", "")).lower()
+        else:
+            code = ""
+            message = str(err).lower()
+
+        return any(k in code or k in message for k in ("rate", "limit", "too_many"))
+
+
+class HTTPClient(_HTTPClientBase):
     """HTTP client for Bitvavo REST API with rate limiting and authentication."""
 
     def __init__(self, settings: BitvavoSettings, rate_limiter: RateLimitManager) -> None:
@@ -36,7 +151,7 @@ class HTTPClient:
 
         self.settings: BitvavoSettings = settings
         self.rate_limiter: RateLimitManager = rate_limiter
-        self._keys: list[tuple[str, str]] = [(item["key"], item["secret"]) for item in self.settings.api_keys]
+        self._keys: tuple[ApiKey, ...] = self.settings.api_keys
         if not self._keys:
             msg = "API keys are required"
             logger.error("api-keys-required")
@@ -50,9 +165,32 @@ class HTTPClient:
         self.api_secret: str = ""
         self._rate_limit_initialized: bool = False
 
-        key, secret = self._keys[0]
-        self.configure_key(key, secret, 0)
-        logger.info("http-client-initialized", key_count=len(self._keys))
+        self.configure_key(self._keys[0].key, self._keys[0].secret, 0)
+
+        # One pooled client for all requests, so connections (and their TLS sessions) get reused
+        self._client = httpx.Client(
+            verify=_ssl_context(),
+            http2=HTTP2_AVAILABLE,
+            timeout=self.settings.access_window_ms / 1000,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        )
+        logger.info("http-client-initialized", key_count=len(self._keys), http2=HTTP2_AVAILABLE)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        self._client.close()
+        logger.debug("http-client-closed")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
 
     def configure_key(self, key: str, secret: str, index: int) -> None:
         """Configure API key for authenticated requests.
@@ -65,6 +203,7 @@ class HTTPClient:
         self.api_key = key
         self.api_secret = secret
         self.key_index = index
+        self._cache_key_state()
         key_suffix = key[-4:] if len(key) >= 4 else "short"
         logger.debug("api-key-configured", index=index, key_suffix=key_suffix)
 
@@ -74,8 +213,7 @@ class HTTPClient:
             msg = "API key index out of range"
             logger.error("api-key-index-out-of-range", index=index, available_keys=len(self._keys))
             raise IndexError(msg)
-        key, secret = self._keys[index]
-        self.configure_key(key, secret, index)
+        self.configure_key(self._keys[index].key, self._keys[index].secret, index)
         logger.debug("api-key-selected", index=index)
 
     def _rotate_key(self) -> bool:
@@ -169,8 +307,10 @@ class HTTPClient:
 
         Raises:
             HTTPError: On transport-level failures
+            ValueError: If `method` isn't supported
         """
         logger.debug("making-request", method=method, endpoint=endpoint, weight=weight)
+        self._check_method(method)
         idx = self.key_index
         self._ensure_rate_limit_initialized()
 
@@ -199,14 +339,15 @@ class HTTPClient:
                 idx = self.key_index  # Update idx after potential key change
 
         url = f"{self.settings.rest_url}{endpoint}"
-        headers = self._create_auth_headers(method, endpoint, body)
+        content = encode_body(body)
+        headers = self._create_auth_headers(method, endpoint, content)
 
         # Update rate limit usage for this call
         self.rate_limiter.record_call(idx, weight)
         logger.debug("weight-recorded", weight=weight, key_index=idx)
 
         try:
-            response = self._make_http_request(method, url, headers, body)
+            response = self._make_http_request(method, url, headers, content)
             logger.debug("request-completed", status_code=response.status_code)
         except httpx.HTTPError as exc:
             logger.error("http-request-failed", error=str(exc))
@@ -231,12 +372,12 @@ class HTTPClient:
         logger.debug("fetching-initial-rate-limit")
 
         while True:
-            headers = self._create_auth_headers("GET", endpoint, None)
+            headers = self._create_auth_headers("GET", endpoint, b"")
             # Record the weight for this check (weight 1)
             self.rate_limiter.record_call(self.key_index, 1)
 
             try:
-                response = self._make_http_request("GET", url, headers, None)
+                response = self._make_http_request("GET", url, headers, b"")
             except httpx.HTTPError as exc:
                 logger.warning("rate-limit-init-failed", error=str(exc))
                 return
@@ -269,72 +410,114 @@ class HTTPClient:
             logger.info("rate-limit-initialization-completed")
             break
 
-    def _create_auth_headers(self, method: str, endpoint: str, body: AnyDict | None) -> dict[str, str]:
-        """Create authentication headers if API key is configured."""
-        timestamp = int(time.time() * 1000) + self.settings.lag_ms
-        signature = create_signature(timestamp, method, endpoint, body, self.api_secret)
-
-        return {
-            "bitvavo-access-key": self.api_key,
-            "bitvavo-access-signature": signature,
-            "bitvavo-access-timestamp": str(timestamp),
-            "bitvavo-access-window": str(self.settings.access_window_ms),
-        }
-
     def _make_http_request(
         self,
         method: str,
         url: str,
         headers: dict[str, str],
-        body: AnyDict | None,
+        content: bytes,
     ) -> httpx.Response:
-        """Make the actual HTTP request."""
-        timeout = self.settings.access_window_ms / 1000
-
-        match method:
-            case "GET":
-                return httpx.get(url, headers=headers, timeout=timeout)
-            case "POST":
-                return httpx.post(url, headers=headers, json=body, timeout=timeout)
-            case "PUT":
-                return httpx.put(url, headers=headers, json=body, timeout=timeout)
-            case "DELETE":
-                return httpx.delete(url, headers=headers, timeout=timeout)
-            case _:
-                msg = f"Unsupported HTTP method: {method}"
-                logger.error("unsupported-http-method", method=method)
-                raise ValueError(msg)
+        """Make the actual HTTP request, sending `content` (the signed, encoded body) for POST and PUT."""
+        return self._client.request(method, url, headers=headers, content=_sent_content(method, headers, content))
 
-    def _update_rate_limits(self, response: httpx.Response, idx: int) -> None:
-        """Update rate limits based on response."""
-        try:
-            json_data = response.json()
-        except ValueError:
-            json_data = {}
 
-        if isinstance(json_data, dict) and "error" in json_data:
-            if self._is_rate_limit_error(response, json_data):
-                logger.warning("rate-limit-error-detected", key_index=idx)
-                self.rate_limiter.update_from_error(idx, json_data)
-            else:
-                logger.debug("non-rate-limit-error", key_index=idx)
-                self.rate_limiter.update_from_headers(idx, dict(response.headers))
-        else:
-            logger.debug("successful-response", key_index=idx)
-            self.rate_limiter.update_from_headers(idx, dict(response.headers))
+class AsyncHTTPClient(_HTTPClientBase):
+    """Async HTTP client for the public Bitvavo REST API.
 
-    def _is_rate_limit_error(self, response: httpx.Response, json_data: dict[str, Any]) -> bool:
-        """Check if response indicates a rate limit error."""
-        status = getattr(response, "status_code", None)
-        if status == httpx.codes.TOO_MANY_REQUESTS:
-            return True
+    All requests go through one `httpx.AsyncClient`, so requests started together (e.g. with `asyncio.gather`) share
+    its connections, and are multiplexed over a single connection when HTTP/2 is available. Requests are signed with
+    the first configured API key, if any, since authenticated requests get higher rate limits.
+    """
 
-        err = json_data.get("error")
-        if isinstance(err, dict):
-            code = str(err.get("code", "")).lower()
-            message = str(err.get("message", "")).lower()
-        else:
-            code = ""
-            message = str(err).lower()
+    def __init__(self, settings: BitvavoSettings, rate_limiter: RateLimitManager) -> None:
+        """Initialize async HTTP client.
 
-        return any(k in code or k in message for k in ("rate", "limit", "too_many"))
+        Args:
+            settings: Bitvavo settings configuration
+            rate_limiter: Rate limit manager instance; can be shared with the sync HTTPClient
+        """
+        self.settings = settings
+        self.rate_limiter = rate_limiter
+        self.key_index: int = 0
+        self.api_key, self.api_secret = (
+            (settings.api_keys[0].key, settings.api_keys[0].secret) if settings.api_keys else ("", "")
+        )
+        self._cache_key_state()
+        self.rate_limiter.ensure_key(self.key_index)
+
+        self._client = httpx.AsyncClient(
+            verify=_ssl_context(),
+            http2=HTTP2_AVAILABLE,
+            timeout=self.settings.access_window_ms / 1000,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20, keepalive_expiry=30.0),
+        )
+        logger.info("async-http-client-initialized", authenticated=bool(self.api_key), http2=HTTP2_AVAILABLE)
+
+    async def aclose(self) -> None:
+        """Close the pooled connections."""
+        await self._client.aclose()
+        logger.debug("async-http-client-closed")
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.aclose()
+
+    async def request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        body: AnyDict | None = None,
+        weight: int = 1,
+    ) -> Result[Any, BitvavoError | httpx.HTTPError]:
+        """Make HTTP request and return raw JSON data as a Result.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            endpoint: API endpoint path
+            body: Request body for POST/PUT requests
+            weight: Rate limit weight of the request
+
+        Returns:
+            Result containing raw JSON response or error
+
+        Raises:
+            ValueError: If `method` isn't supported
+        """
+        logger.debug("making-async-request", method=method, endpoint=endpoint, weight=weight)
+        self._check_method(method)
+        idx = self.key_index
+
+        if not self.rate_limiter.has_budget(idx, weight):
+            # Same as RateLimitManager.sleep_until_reset, without blocking the event loop
+            ms_left = max(0, self.rate_limiter.get_reset_at(idx) - int(time.time() * 1000))
+            logger.info("async-rate-limit-exceeded", key_idx=idx, sleep_seconds=ms_left / 1000 + 1)
+            await asyncio.sleep(ms_left / 1000 + 1)
+            self.rate_limiter.reset_key(idx)
+
+        url = f"{self.settings.rest_url}{endpoint}"
+        content = encode_body(body)
+        headers = self._create_auth_headers(method, endpoint, content) if self.api_key else {}
+        self.rate_limiter.record_call(idx, weight)
+
+        try:
+            response = await self._client.request(
+                method,
+                url,
+                headers=headers,
+                content=_sent_content(method, headers, content),
+            )
+            logger.debug("async-request-completed", status_code=response.status_code)
+        except httpx.HTTPError as exc:
+            logger.error("async-http-request-failed", error=str(exc))
+            return Failure(exc)
+
+        self._update_rate_limits(response, idx)
+        return decode_response_result(response, model=Any)
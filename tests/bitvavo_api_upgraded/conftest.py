@@ -26,10 +26,6 @@ def websocket(bitvavo: Bitvavo) -> Bitvavo.WebSocketAppFacade:
         msg = f"Error callback: {error}"
         logger.error(msg)
 
-    settings = bitvavo_settings.model_dump()
-    settings["APIKEYS"] = [{"key": "k", "secret": "s"}]
-    bitvavo = Bitvavo(settings)
-
     websocket: Bitvavo.WebSocketAppFacade = bitvavo.new_websocket()
     websocket.set_error_callback(error_callback)
     return websocket
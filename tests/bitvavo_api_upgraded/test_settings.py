@@ -1,10 +1,35 @@
+import contextlib
 import os
+import subprocess
+import sys
 import tempfile
-from unittest.mock import patch
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 
-from bitvavo_api_upgraded.settings import BitvavoApiUpgradedSettings, BitvavoSettings
+from bitvavo_api_upgraded import settings
+from bitvavo_api_upgraded.settings import (
+    BitvavoApiUpgradedSettings,
+    BitvavoSettings,
+    _detect_ssl_cert,
+    get_bitvavo_settings,
+    get_upgraded_settings,
+)
+
+
+def fake_scandir(*existing: str) -> Mock:
+    """Build an `os.scandir` replacement that only sees the given files."""
+
+    def scandir(directory: str) -> contextlib.nullcontext[Iterator[SimpleNamespace]]:
+        names = [name for parent, _, name in (path.rpartition("/") for path in existing) if parent == directory]
+        if not names:
+            raise FileNotFoundError(directory)
+        return contextlib.nullcontext(iter([SimpleNamespace(name=name, is_file=lambda: True) for name in names]))
+
+    return Mock(side_effect=scandir)
 
 
 @pytest.mark.parametrize(
@@ -12,6 +37,7 @@ from bitvavo_api_upgraded.settings import BitvavoApiUpgradedSettings, BitvavoSet
     [
         ("INFO", "INFO"),
         ("DEBUG", "DEBUG"),
+        ("warning", "WARNING"),
         ("INVALID", pytest.raises(ValueError)),  # noqa: PT011
     ],
 )
@@ -23,135 +49,208 @@ def test_validate_log_level(log_level: str, expected: str) -> None:
             BitvavoApiUpgradedSettings.validate_log_level(log_level)
 
 
-def test_api_rating_limit_per_second() -> None:
+@pytest.mark.parametrize(
+    ("env", "kwargs", "expected"),
+    [
+        pytest.param(
+            {}, {"API_RATING_LIMIT_PER_SECOND": 5}, {"API_RATING_LIMIT_PER_SECOND": 5}, id="explicit-per-second"
+        ),
+        pytest.param(
+            {"BITVAVO_API_RATING_LIMIT_PER_SECOND": "5"},
+            {},
+            {"API_RATING_LIMIT_PER_SECOND": 5},
+            id="per-second-from-env",
+        ),
+        pytest.param(
+            {},
+            {"API_RATING_LIMIT_PER_MINUTE": 120},
+            # Explicit per-minute input is kept as is; the per-second limit is derived by dividing it by 60
+            {"API_RATING_LIMIT_PER_MINUTE": 120, "API_RATING_LIMIT_PER_SECOND": 2},
+            id="per-second-derived-from-per-minute",
+        ),
+    ],
+)
+def test_api_rating_limits(
+    monkeypatch: pytest.MonkeyPatch,
+    env: dict[str, str],
+    kwargs: dict[str, int],
+    expected: dict[str, int],
+) -> None:
+    monkeypatch.delenv("BITVAVO_API_RATING_LIMIT_PER_SECOND", raising=False)
+    for key, value in env.items():
+        monkeypatch.setenv(key, value)
+
+    settings = BitvavoSettings(**kwargs)
+
+    assert {name: getattr(settings, name) for name in expected} == expected
+
+
+def test_module_level_settings_are_lazy_singletons() -> None:
     """
-    Input divided by 60
+    The module-level names are built on first access and reused afterwards
     """
-    settings = BitvavoSettings(API_RATING_LIMIT_PER_SECOND=120)
-    assert settings.API_RATING_LIMIT_PER_SECOND == 2
+    assert isinstance(settings.bitvavo_settings, BitvavoSettings)
+    assert settings.bitvavo_settings is settings.BITVAVO
+    assert isinstance(settings.bitvavo_upgraded_settings, BitvavoApiUpgradedSettings)
+    assert settings.bitvavo_upgraded_settings is settings.BITVAVO_API_UPGRADED
 
 
-def test_api_rating_limit_per_minute() -> None:
+def test_env_file_resolved_at_instantiation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
     """
-    Input not changed
+    The .env file is looked up in the cwd at the time the settings are built, not at import time
     """
-    val = 120
-    settings = BitvavoSettings(API_RATING_LIMIT_PER_MINUTE=val)
-    assert settings.API_RATING_LIMIT_PER_MINUTE == val  # noqa: SIM300
+    monkeypatch.delenv("BITVAVO_ACCESSWINDOW", raising=False)
+    (tmp_path / ".env").write_text("BITVAVO_ACCESSWINDOW=1234\n")
+    monkeypatch.chdir(tmp_path)
+
+    assert BitvavoSettings().ACCESSWINDOW == 1234
+
+
+def test_settings_factories_are_cached() -> None:
+    assert get_bitvavo_settings() is get_bitvavo_settings()
+    assert get_bitvavo_settings() is settings.bitvavo_settings
+    assert get_upgraded_settings() is get_upgraded_settings()
+    assert get_upgraded_settings() is settings.bitvavo_upgraded_settings
+
+
+def test_importing_package_does_not_build_settings() -> None:
+    """
+    Importing the package (and thus the Bitvavo class) must not read `.env` or probe for SSL certificates
+    """
+    code = (
+        "import bitvavo_api_upgraded\n"
+        "from bitvavo_api_upgraded.settings import get_bitvavo_settings, get_upgraded_settings\n"
+        "assert get_upgraded_settings.cache_info().currsize == 0, get_upgraded_settings.cache_info()\n"
+        "assert get_bitvavo_settings.cache_info().currsize == 0, get_bitvavo_settings.cache_info()\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    subprocess.run([sys.executable, "-c", code], check=True, env=env)  # noqa: S603
+
+
+def test_module_unknown_attribute() -> None:
+    with pytest.raises(AttributeError, match="has no attribute 'does_not_exist'"):
+        _ = settings.does_not_exist
 
 
 class TestSSLCertificateConfiguration:
     """Tests for the SSL certificate auto-detection and configuration."""
 
+    @pytest.fixture(autouse=True)
+    def clear_ssl_cert_cache(self) -> Iterator[None]:
+        """Make sure mocked filesystem results don't leak between tests via the memoized probe."""
+        _detect_ssl_cert.cache_clear()
+        yield
+        _detect_ssl_cert.cache_clear()
+
+    @pytest.fixture(autouse=True)
+    def unset_ssl_cert_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Start each test without SSL_CERT_FILE, and put back the original value afterwards.
+
+        The settings write SSL_CERT_FILE to os.environ themselves, so the variable is set through monkeypatch first:
+        that records the original value (or its absence) for teardown, which `delenv` alone doesn't when it's unset.
+        """
+        monkeypatch.setenv("SSL_CERT_FILE", "")
+        monkeypatch.delenv("SSL_CERT_FILE")
+
     def test_ssl_cert_file_set_explicitly(self) -> None:
         """Test when SSL_CERT_FILE is explicitly set to a valid path."""
         with tempfile.NamedTemporaryFile() as temp_cert:
-            original_env = os.environ.get("SSL_CERT_FILE")
-            try:
-                settings = BitvavoApiUpgradedSettings(SSL_CERT_FILE=temp_cert.name)
-                assert temp_cert.name == settings.SSL_CERT_FILE
-                assert temp_cert.name == os.environ.get("SSL_CERT_FILE")
-            finally:
-                # Restore original environment
-                if original_env is not None:
-                    os.environ["SSL_CERT_FILE"] = original_env
-                elif "SSL_CERT_FILE" in os.environ:
-                    del os.environ["SSL_CERT_FILE"]
+            settings = BitvavoApiUpgradedSettings(SSL_CERT_FILE=temp_cert.name)
+            assert temp_cert.name == settings.SSL_CERT_FILE
+            assert temp_cert.name == os.environ.get("SSL_CERT_FILE")
 
     def test_ssl_cert_file_explicit_but_missing(self) -> None:
         """Test when SSL_CERT_FILE is set but the file doesn't exist."""
         with pytest.raises(FileNotFoundError, match="SSL certificate file not found"):
             BitvavoApiUpgradedSettings(SSL_CERT_FILE="/nonexistent/cert.pem")
 
+    def test_ssl_cert_file_empty_is_treated_as_unset(self) -> None:
+        """Test that an empty SSL_CERT_FILE is never exported, even though `Path("")` points at the cwd."""
+        with patch("bitvavo_api_upgraded.settings.os.scandir", fake_scandir()):
+            settings = BitvavoApiUpgradedSettings(SSL_CERT_FILE="")
+            assert not settings.SSL_CERT_FILE
+            assert "SSL_CERT_FILE" not in os.environ
+
+    def test_ssl_cert_file_directory_is_rejected(self, tmp_path: Path) -> None:
+        """Test that SSL_CERT_FILE must point at a file, not a directory."""
+        with pytest.raises(FileNotFoundError, match="SSL certificate file not found"):
+            BitvavoApiUpgradedSettings(SSL_CERT_FILE=str(tmp_path))
+
     def test_ssl_cert_file_auto_detection_success(self) -> None:
         """Test successful auto-detection of SSL certificate file."""
-        original_env = os.environ.get("SSL_CERT_FILE")
-        try:
-            # Ensure SSL_CERT_FILE is not set in environment to allow auto-detection
-            if "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
-
-            # Mock the Path constructor and exists method
-            with patch("bitvavo_api_upgraded.settings.Path") as mock_path_class:
-                # Set up the mock to return a specific Path object that has exists() return True
-                # for the first certificate path
-                mock_path_instance = mock_path_class.return_value
-                mock_path_instance.exists.side_effect = (
-                    lambda: str(mock_path_class.call_args[0][0]) == "/etc/ssl/certs/ca-certificates.crt"
-                )
-
-                settings = BitvavoApiUpgradedSettings()
-                assert settings.SSL_CERT_FILE == "/etc/ssl/certs/ca-certificates.crt"
-                assert os.environ.get("SSL_CERT_FILE") == "/etc/ssl/certs/ca-certificates.crt"
-        finally:
-            # Cleanup
-            if original_env is not None:
-                os.environ["SSL_CERT_FILE"] = original_env
-            elif "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
+        with patch("bitvavo_api_upgraded.settings.os.scandir", fake_scandir("/etc/ssl/certs/ca-certificates.crt")):
+            settings = BitvavoApiUpgradedSettings()
+            assert settings.SSL_CERT_FILE == "/etc/ssl/certs/ca-certificates.crt"
+            assert os.environ.get("SSL_CERT_FILE") == "/etc/ssl/certs/ca-certificates.crt"
 
     def test_ssl_cert_file_auto_detection_no_certs_found(self) -> None:
         """Test when no SSL certificates are found during auto-detection."""
-        original_env = os.environ.get("SSL_CERT_FILE")
-        try:
-            # Mock Path.exists to return False for all paths
-            with patch("bitvavo_api_upgraded.settings.Path.exists", return_value=False):
-                settings = BitvavoApiUpgradedSettings()
-                assert settings.SSL_CERT_FILE is None
-                # Environment should not be modified
-                assert original_env == os.environ.get("SSL_CERT_FILE")
-        finally:
-            # Restore original environment
-            if original_env is not None:
-                os.environ["SSL_CERT_FILE"] = original_env
-            elif "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
+        # None of the candidate directories exist
+        with patch("bitvavo_api_upgraded.settings.os.scandir", fake_scandir()):
+            settings = BitvavoApiUpgradedSettings()
+            assert settings.SSL_CERT_FILE is None
+            # Environment should not be modified
+            assert "SSL_CERT_FILE" not in os.environ
 
     def test_ssl_cert_file_precedence_order(self) -> None:
         """Test that SSL certificate detection follows the correct precedence order."""
-        original_env = os.environ.get("SSL_CERT_FILE")
-        try:
-            # Ensure SSL_CERT_FILE is not set in environment to allow auto-detection
-            if "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
-
-            # Mock the Path constructor to control exists() behavior
-            with patch("bitvavo_api_upgraded.settings.Path") as mock_path_class:
-                # Set up the mock to return a specific Path object that has exists() return True
-                # for both Debian and CentOS certificate paths
-                mock_path_instance = mock_path_class.return_value
-                mock_path_instance.exists.side_effect = lambda: str(mock_path_class.call_args[0][0]) in [
-                    "/etc/ssl/certs/ca-certificates.crt",
-                    "/etc/ssl/certs/ca-bundle.crt",
-                ]
-
-                settings = BitvavoApiUpgradedSettings()
-                # Should pick the first one in the list (Debian/Ubuntu/NixOS)
-                assert settings.SSL_CERT_FILE == "/etc/ssl/certs/ca-certificates.crt"
-                assert os.environ.get("SSL_CERT_FILE") == "/etc/ssl/certs/ca-certificates.crt"
-        finally:
-            if original_env is not None:
-                os.environ["SSL_CERT_FILE"] = original_env
-            elif "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
+        with patch(
+            "bitvavo_api_upgraded.settings.os.scandir",
+            fake_scandir("/etc/ssl/certs/ca-bundle.crt", "/etc/ssl/certs/ca-certificates.crt"),
+        ):
+            settings = BitvavoApiUpgradedSettings()
+            # Should pick the first one in the list (Debian/Ubuntu/NixOS)
+            assert settings.SSL_CERT_FILE == "/etc/ssl/certs/ca-certificates.crt"
+            assert os.environ.get("SSL_CERT_FILE") == "/etc/ssl/certs/ca-certificates.crt"
+
+    def test_ssl_cert_detection_does_not_recheck_found_path(self) -> None:
+        """Test that an auto-detected certificate path is only probed once."""
+        with (
+            patch("bitvavo_api_upgraded.settings.os.scandir", fake_scandir("/etc/ssl/certs/ca-certificates.crt")),
+            patch("bitvavo_api_upgraded.settings.Path") as mock_path_class,
+        ):
+            settings = BitvavoApiUpgradedSettings()
+            assert settings.SSL_CERT_FILE == "/etc/ssl/certs/ca-certificates.crt"
+            mock_path_class.assert_not_called()
 
     def test_ssl_cert_file_environment_persistence(self) -> None:
         """Test that the SSL_CERT_FILE environment variable persists after settings creation."""
-        original_env = os.environ.get("SSL_CERT_FILE")
-        try:
-            with tempfile.NamedTemporaryFile() as temp_cert:
-                # Create settings with explicit SSL cert file
-                _ = BitvavoApiUpgradedSettings(SSL_CERT_FILE=temp_cert.name)
-
-                # Verify environment variable is set
-                assert os.environ.get("SSL_CERT_FILE") == temp_cert.name
-
-                # Create another settings instance without SSL_CERT_FILE
-                # It should not auto-detect since env var is already set
-                _ = BitvavoApiUpgradedSettings()
-                assert os.environ.get("SSL_CERT_FILE") == temp_cert.name
-        finally:
-            if original_env is not None:
-                os.environ["SSL_CERT_FILE"] = original_env
-            elif "SSL_CERT_FILE" in os.environ:
-                del os.environ["SSL_CERT_FILE"]
+        with tempfile.NamedTemporaryFile() as temp_cert:
+            # Create settings with explicit SSL cert file
+            _ = BitvavoApiUpgradedSettings(SSL_CERT_FILE=temp_cert.name)
+
+            # Verify environment variable is set
+            assert os.environ.get("SSL_CERT_FILE") == temp_cert.name
+
+            # Create another settings instance without SSL_CERT_FILE
+            # It should not auto-detect since env var is already set
+            _ = BitvavoApiUpgradedSettings()
+            assert os.environ.get("SSL_CERT_FILE") == temp_cert.name
+
+    def test_ssl_cert_detection_is_memoized(self) -> None:
+        """Test that the certificate paths are only probed once per process."""
+        scandir = fake_scandir("/etc/ssl/certs/ca-certificates.crt")
+        with patch("bitvavo_api_upgraded.settings.os.scandir", scandir):
+            assert _detect_ssl_cert() == "/etc/ssl/certs/ca-certificates.crt"
+            assert _detect_ssl_cert() == "/etc/ssl/certs/ca-certificates.crt"
+            assert scandir.call_count == 1
+
+    def test_ssl_cert_detection_lists_each_directory_once(self) -> None:
+        """Test that candidates sharing a directory are found with a single listing."""
+        scandir = fake_scandir("/etc/pki/tls/certs/ca-bundle.crt")
+        with patch("bitvavo_api_upgraded.settings.os.scandir", scandir):
+            assert _detect_ssl_cert() == "/etc/pki/tls/certs/ca-bundle.crt"
+        assert [call.args[0] for call in scandir.call_args_list] == [
+            "/etc/ssl/certs",
+            "/etc/ssl",
+            "/usr/local/share/certs",
+            "/etc/pki/tls/certs",
+        ]
+
+    def test_ssl_cert_detection_skips_dangling_symlinks(self, tmp_path: Path) -> None:
+        """Test that a candidate that is a dangling symlink is not picked."""
+        (tmp_path / "ca-certificates.crt").symlink_to(tmp_path / "missing.crt")
+        (tmp_path / "ca-bundle.crt").write_text("")
+        candidates = {str(tmp_path): ("ca-certificates.crt", "ca-bundle.crt")}
+        with patch("bitvavo_api_upgraded.settings._SSL_CERT_CANDIDATES", candidates):
+            assert _detect_ssl_cert() == f"{tmp_path}/ca-bundle.crt"
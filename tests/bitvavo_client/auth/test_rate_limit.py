@@ -5,6 +5,7 @@ from __future__ import annotations
 import time
 from unittest.mock import MagicMock, patch
 
+import httpx
 import pytest
 
 from bitvavo_client.auth.rate_limit import RateLimitManager
@@ -194,6 +195,17 @@ class TestRateLimitManagerHeaderUpdates:
         assert manager.state[0]["remaining"] == 750
         assert manager.state[0]["resetAt"] == 1693843200000
 
+    def test_update_from_httpx_headers(self) -> None:
+        """Test that httpx.Headers can be passed without copying, and are matched case-insensitively."""
+        manager = RateLimitManager(default_remaining=1000, buffer=50)
+
+        headers = httpx.Headers({"Bitvavo-Ratelimit-Remaining": "750", "Bitvavo-Ratelimit-ResetAt": "1693843200000"})
+
+        manager.update_from_headers(0, headers)
+
+        assert manager.state[0]["remaining"] == 750
+        assert manager.state[0]["resetAt"] == 1693843200000
+
     def test_update_from_headers_remaining_only(self) -> None:
         """Test updating state when only remaining header is present."""
         manager = RateLimitManager(default_remaining=1000, buffer=50)
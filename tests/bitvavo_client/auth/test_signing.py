@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from bitvavo_client.auth.signing import create_signature
+from bitvavo_client.auth.signing import create_signature, create_signer, encode_body
 
 
 class TestCreateSignature:
@@ -346,3 +346,18 @@ class TestCreateSignature:
 
         assert isinstance(signature, str)
         assert len(signature) == 64
+
+    def test_create_signer_matches_create_signature(self) -> None:
+        """Test that a reused signer produces the same signatures as create_signature."""
+        api_secret = "test-secret-key"
+        sign = create_signer(api_secret)
+        requests = [
+            (1693843200000, "GET", "/markets", None),
+            (1693843200001, "POST", "/order", {"market": "BTC-EUR", "side": "buy", "amount": "0.001"}),
+            (1693843200002, "DELETE", "/order?market=BTC-EUR&orderId=1", {}),
+        ]
+
+        for timestamp, method, url, body in requests:
+            assert sign(timestamp, method, url, encode_body(body)) == create_signature(
+                timestamp, method, url, body, api_secret
+            )
@@ -0,0 +1,68 @@
+"""Tests for bitvavo_client.core.settings module."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from bitvavo_client.core.settings import ApiKey, BitvavoSettings, get_core_settings
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    import pytest
+
+
+def test_env_file_resolved_at_instantiation(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BITVAVO_ACCESS_WINDOW_MS", raising=False)
+    (tmp_path / ".env").write_text("BITVAVO_ACCESS_WINDOW_MS=1234\n")
+    monkeypatch.chdir(tmp_path)
+
+    assert BitvavoSettings().access_window_ms == 1234
+
+
+def test_get_core_settings_is_cached() -> None:
+    settings = get_core_settings()
+
+    assert isinstance(settings, BitvavoSettings)
+    assert get_core_settings() is settings
+
+
+def test_get_core_settings_cache_clear() -> None:
+    settings = get_core_settings()
+    get_core_settings.cache_clear()
+
+    assert get_core_settings() is not settings
+
+
+def test_api_keys_are_converted_to_api_key_tuples() -> None:
+    settings = BitvavoSettings(api_keys=[{"key": "k1", "secret": "s1"}, ("k2", "s2")])
+
+    assert settings.api_keys == (ApiKey("k1", "s1"), ApiKey("k2", "s2"))
+    assert settings.api_keys[0].key == "k1"
+    assert settings.api_keys[1].secret == "s2"
+
+
+def test_api_keys_accept_rate_limit_and_ignore_extra_entries() -> None:
+    settings = BitvavoSettings(
+        api_keys=[
+            {"key": "k1", "secret": "s1", "rate_limit": "500", "label": "bot"},
+            {"key": "k2", "secret": "s2", "note": "spare"},
+        ],
+    )
+
+    assert settings.api_keys == (ApiKey("k1", "s1", 500), ApiKey("k2", "s2"))
+    assert settings.api_keys[1].rate_limit == 1000
+
+
+def test_api_keys_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("BITVAVO_API_KEYS", '[{"key": "k", "secret": "s"}]')
+
+    assert BitvavoSettings().api_keys == (ApiKey("k", "s"),)
+
+
+def test_single_api_key_fills_api_keys(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.delenv("BITVAVO_API_KEYS", raising=False)
+    monkeypatch.setenv("BITVAVO_APIKEY", "k")
+    monkeypatch.setenv("BITVAVO_APISECRET", "s")
+
+    assert BitvavoSettings().api_keys == (ApiKey("k", "s"),)
@@ -11,6 +11,8 @@ from bitvavo_client.core.validation_helpers import format_validation_error, safe
 class TestModel(BaseModel):
     """Test model for validation testing."""
 
+    __test__ = False  # a model, not a test class
+
     name: str
     age: int
     price: str
@@ -42,6 +44,27 @@ class OrderModel(BaseModel):
         return v
 
 
+class NestedModel(BaseModel):
+    """Test model with a nested model field, for nested error paths."""
+
+    user: TestModel
+
+
+class LargeModel(BaseModel):
+    """Test model with many fields, to generate many errors at once."""
+
+    field1: str
+    field2: str
+    field3: str
+    field4: str
+    field5: str
+    field6: str
+    field7: str
+    field8: str
+    field9: str
+    field10: str
+
+
 class TestFormatValidationError:
     """Test format_validation_error function."""
 
@@ -192,9 +215,6 @@ class TestFormatValidationError:
     def test_format_error_nested_field_path(self) -> None:
         """Test formatting error with nested field paths."""
 
-        class NestedModel(BaseModel):
-            user: TestModel
-
         try:
             NestedModel(user={"name": 123, "age": 25, "price": "10.50"})  # type: ignore[arg-type]
         except ValidationError as e:
@@ -330,19 +350,6 @@ class TestValidationHelpersIntegration:
     def test_validation_helpers_performance_with_large_errors(self) -> None:
         """Test that validation helpers handle large validation errors efficiently."""
 
-        # Create a model with many fields to generate many errors
-        class LargeModel(BaseModel):
-            field1: str
-            field2: str
-            field3: str
-            field4: str
-            field5: str
-            field6: str
-            field7: str
-            field8: str
-            field9: str
-            field10: str
-
         # Pass all wrong types to generate many errors
         invalid_data = {f"field{i}": i for i in range(1, 11)}
 
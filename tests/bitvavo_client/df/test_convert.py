@@ -32,7 +32,7 @@ class TestIsNarwhalsAvailable:
     def test_narwhals_not_available(self) -> None:
         """Test when narwhals is not available."""
         # Mock ImportError
-        with patch("builtins.__import__", side_effect=ImportError("No module named 'narwhals'")):
+        with patch.dict("sys.modules", {"narwhals": None}):
             result = is_narwhals_available()
             assert result is False
 
@@ -133,7 +133,7 @@ class TestConvertToDataframe:
 
         with (
             patch("bitvavo_client.df.convert.is_narwhals_available", return_value=True),
-            patch("builtins.__import__", side_effect=ImportError("No module named 'pandas'")),
+            patch.dict("sys.modules", {"pandas": None}),
             pytest.raises(ImportError, match="Library pandas not available"),
         ):
             convert_to_dataframe(test_data, "pandas")
@@ -144,7 +144,7 @@ class TestConvertToDataframe:
 
         with (
             patch("bitvavo_client.df.convert.is_narwhals_available", return_value=True),
-            patch("builtins.__import__", side_effect=ImportError("No module named 'polars'")),
+            patch.dict("sys.modules", {"polars": None}),
             pytest.raises(ImportError, match="Library polars not available"),
         ):
             convert_to_dataframe(test_data, "polars")
@@ -374,7 +374,7 @@ class TestConvertCandlesToDataframe:
 
         with (
             patch("bitvavo_client.df.convert.is_narwhals_available", return_value=True),
-            patch("builtins.__import__", side_effect=ImportError("No module named 'pandas'")),
+            patch.dict("sys.modules", {"pandas": None}),
             pytest.raises(ImportError, match="Library pandas not available"),
         ):
             convert_candles_to_dataframe(test_data, "pandas")
@@ -7,6 +7,7 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from decimal import Decimal, InvalidOperation
 from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock
 
 import polars as pl
 import pytest
@@ -19,7 +20,7 @@ from bitvavo_client.adapters.returns_adapter import BitvavoError
 from bitvavo_client.auth.rate_limit import RateLimitManager
 from bitvavo_client.core import private_models
 from bitvavo_client.core.model_preferences import ModelPreference
-from bitvavo_client.core.settings import BitvavoSettings
+from bitvavo_client.core.settings import BitvavoSettings, get_core_settings
 from bitvavo_client.endpoints.private import PrivateAPI
 from bitvavo_client.schemas import private_schemas
 from bitvavo_client.transport.http import HTTPClient
@@ -115,13 +116,13 @@ class AbstractPrivateAPITests(ABC):
 
 
 @pytest.mark.skipif(
-    not hasattr(BitvavoSettings(), "api_key") or not BitvavoSettings().api_key,
+    not hasattr(get_core_settings(), "api_key") or not get_core_settings().api_key,
     reason="API credentials required for private endpoints",
 )
 class TestPrivateAPI_RAW(AbstractPrivateAPITests):  # noqa: N801
     @pytest.fixture(scope="module")
     def private_api(self) -> PrivateAPI:
-        settings = BitvavoSettings()
+        settings = get_core_settings()
         rate_limiter = RateLimitManager(
             settings.default_rate_limit,
             settings.rate_limit_buffer,
@@ -1561,14 +1562,14 @@ class TestPrivateAPI_RAW(AbstractPrivateAPITests):  # noqa: N801
 
 
 @pytest.mark.skipif(
-    not hasattr(BitvavoSettings(), "api_key") or not BitvavoSettings().api_key,
+    not hasattr(get_core_settings(), "api_key") or not get_core_settings().api_key,
     reason="API credentials required for private endpoints",
 )
 class TestPrivateAPI_PYDANTIC(AbstractPrivateAPITests):  # noqa: N801
     @pytest.fixture(scope="module")
     def private_api(self) -> PrivateAPI:
         """Private API with default MODEL preference (pydantic models)."""
-        settings = BitvavoSettings()
+        settings = get_core_settings()
         rate_limiter = RateLimitManager(
             settings.default_rate_limit,
             settings.rate_limit_buffer,
@@ -2002,7 +2003,7 @@ class TestPrivateAPI_PYDANTIC(AbstractPrivateAPITests):  # noqa: N801
 
 
 @pytest.mark.skipif(
-    not hasattr(BitvavoSettings(), "api_key") or not BitvavoSettings().api_key,
+    not hasattr(get_core_settings(), "api_key") or not get_core_settings().api_key,
     reason="API credentials required for private endpoints",
 )
 class TestPrivateAPI_DATAFRAME(AbstractPrivateAPITests):  # noqa: N801
@@ -2011,7 +2012,7 @@ class TestPrivateAPI_DATAFRAME(AbstractPrivateAPITests):  # noqa: N801
     @pytest.fixture(scope="module")
     def private_api(self) -> PrivateAPI:
         """Private API with DATAFRAME preference (polars.DataFrame)."""
-        settings = BitvavoSettings()
+        settings = get_core_settings()
         rate_limiter = RateLimitManager(
             settings.default_rate_limit,
             settings.rate_limit_buffer,
@@ -2323,26 +2324,22 @@ class TestPrivateAPI_DATAFRAME(AbstractPrivateAPITests):  # noqa: N801
 class TestGetOrdersValidation:
     """Unit tests for get_orders parameter validation."""
 
-    def test_get_orders_invalid_limit(self) -> None:
-        """Test get_orders with invalid limit values."""
+    @pytest.fixture(scope="module")
+    def private_api(self) -> PrivateAPI:
+        """Validation fails before any request is made, so the tests share one keyed client."""
         settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
-        rate_limiter = RateLimitManager(100, 10)
-        http_client = HTTPClient(settings, rate_limiter)
-        private_api = PrivateAPI(http_client)
+        return PrivateAPI(HTTPClient(settings, RateLimitManager(100, 10)))
 
+    def test_get_orders_invalid_limit(self, private_api: PrivateAPI) -> None:
+        """Test get_orders with invalid limit values."""
         # Test invalid limits
         invalid_limits = [0, -1, 1001, 2000, "500", None]
         for limit in invalid_limits:
             with pytest.raises(ValueError, match="Invalid limit"):
                 private_api.get_orders("BTC-EUR", {"limit": limit})
 
-    def test_get_orders_invalid_end_timestamp(self) -> None:
+    def test_get_orders_invalid_end_timestamp(self, private_api: PrivateAPI) -> None:
         """Test get_orders with invalid end timestamp."""
-        settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
-        rate_limiter = RateLimitManager(100, 10)
-        http_client = HTTPClient(settings, rate_limiter)
-        private_api = PrivateAPI(http_client)
-
         # Test invalid end timestamps
         max_timestamp = 8640000000000000
         invalid_ends = [max_timestamp + 1, max_timestamp + 1000000, "1234567890"]
@@ -2350,13 +2347,8 @@ class TestGetOrdersValidation:
             with pytest.raises(ValueError, match="Invalid end timestamp"):
                 private_api.get_orders("BTC-EUR", {"end": end})
 
-    def test_get_orders_start_greater_than_end(self) -> None:
+    def test_get_orders_start_greater_than_end(self, private_api: PrivateAPI) -> None:
         """Test get_orders when start timestamp is greater than end timestamp."""
-        settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
-        rate_limiter = RateLimitManager(100, 10)
-        http_client = HTTPClient(settings, rate_limiter)
-        private_api = PrivateAPI(http_client)
-
         # Test start > end
         with pytest.raises(ValueError, match="Start timestamp .* cannot be greater than end timestamp"):
             private_api.get_orders("BTC-EUR", {"start": 1000000, "end": 999999})
@@ -2410,3 +2402,91 @@ class TestWithdrawResponseValidation:
         }
 
         assert expected_schema == private_schemas.WITHDRAW_RESPONSE_SCHEMA
+
+
+class TestPrivateAPIRoutes:
+    """Test the route table without hitting the network."""
+
+    @pytest.fixture
+    def private_api(self) -> PrivateAPI:
+        http = Mock(spec=HTTPClient)
+        http.request.return_value = Success({})
+        return PrivateAPI(http)
+
+    def test_call_uses_route_method_path_and_weight(self, private_api: PrivateAPI) -> None:
+        private_api.balance({"symbol": "BTC"})
+
+        private_api.http.request.assert_called_once_with("GET", "/balance?symbol=BTC", body=None, weight=5)
+
+    @pytest.mark.parametrize(("route", "expected"), PrivateAPI._routes.items())  # noqa: SLF001
+    def test_call_sends_each_route_in_one_request(
+        self,
+        private_api: PrivateAPI,
+        route: str,
+        expected: tuple[str, str, int],
+    ) -> None:
+        method, path, weight = expected
+
+        private_api._call(route, {"market": "BTC-EUR"})  # noqa: SLF001
+
+        private_api.http.request.assert_called_once_with(method, path + "?market=BTC-EUR", body=None, weight=weight)
+
+    def test_call_weight_override(self, private_api: PrivateAPI) -> None:
+        private_api.orders_open({"market": "BTC-EUR"})
+        private_api.orders_open()
+
+        assert private_api.http.request.call_args_list[0].kwargs["weight"] == 1
+        assert private_api.http.request.call_args_list[1].kwargs["weight"] == 25
+
+    def test_request_patched_after_construction_is_used(self, private_api: PrivateAPI) -> None:
+        replacement = Mock(return_value=Success({"fees": {}}))
+        private_api.http.request = replacement
+
+        assert private_api.account() == Success({"fees": {}})
+        replacement.assert_called_once_with("GET", "/account", body=None, weight=1)
+
+    def test_endpoint_models_resolve_to_pydantic_models(self) -> None:
+        private_api = PrivateAPI(Mock(spec=HTTPClient), preferred_model=ModelPreference.PYDANTIC)
+
+        for endpoint_type, model_name in PrivateAPI._endpoint_models.items():  # noqa: SLF001
+            model, _ = private_api._get_effective_model(endpoint_type, None, None)  # noqa: SLF001
+            assert model is getattr(private_models, model_name)
+
+        assert private_api._get_effective_model("unknown", None, None) == (dict, None)  # noqa: SLF001
+
+    def test_call_passes_body(self, private_api: PrivateAPI) -> None:
+        private_api.withdraw("BTC", "1.5", "address")
+
+        private_api.http.request.assert_called_once_with(
+            "POST",
+            "/withdrawal",
+            body={"symbol": "BTC", "amount": "1.5", "address": "address"},
+            weight=1,
+        )
+
+    def test_place_order_does_not_mutate_body(self, private_api: PrivateAPI) -> None:
+        body = {"amount": "1", "price": "2", "responseRequired": False}
+
+        private_api.place_order("BTC-EUR", "buy", "limit", 1, body)
+
+        assert body == {"amount": "1", "price": "2", "responseRequired": False}
+        assert private_api.http.request.call_args.kwargs["body"] == {
+            "market": "BTC-EUR",
+            "side": "buy",
+            "orderType": "limit",
+            "operatorId": 1,
+            "responseRequired": False,
+            "amount": "1",
+            "price": "2",
+        }
+
+    def test_update_order_skips_unset_parameters(self, private_api: PrivateAPI) -> None:
+        private_api.update_order("BTC-EUR", 1, order_id="o", price="2", post_only=False)
+
+        assert private_api.http.request.call_args.kwargs["body"] == {
+            "market": "BTC-EUR",
+            "operatorId": 1,
+            "orderId": "o",
+            "price": "2",
+            "postOnly": False,
+        }
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import Any
+from unittest.mock import AsyncMock, Mock
 
 import httpx
 import polars as pl
@@ -13,9 +15,9 @@ from returns.result import Failure, Success
 from bitvavo_client.auth.rate_limit import RateLimitManager
 from bitvavo_client.core import public_models
 from bitvavo_client.core.model_preferences import ModelPreference
-from bitvavo_client.core.settings import BitvavoSettings
-from bitvavo_client.endpoints.public import CandleInterval, PublicAPI
-from bitvavo_client.transport.http import HTTPClient
+from bitvavo_client.core.settings import get_core_settings
+from bitvavo_client.endpoints.public import AsyncPublicAPI, CandleInterval, PublicAPI
+from bitvavo_client.transport.http import AsyncHTTPClient, HTTPClient
 
 # for printing Polars
 pl.Config.set_tbl_width_chars(200)
@@ -35,7 +37,7 @@ class AbstractPublicAPITests(ABC):
 
     def _create_http_client(self) -> HTTPClient:
         """Create a shared HTTP client for all fixtures."""
-        settings = BitvavoSettings()
+        settings = get_core_settings()
         rate_limiter = RateLimitManager(
             settings.default_rate_limit,
             settings.rate_limit_buffer,
@@ -2798,3 +2800,119 @@ class TestPublicAPI_DATAFRAME(AbstractPublicAPITests):  # noqa: N801
         assert isinstance(missing_price, str), "missingPrice must be string"
         if missing_price:
             assert missing_price in ["PNDG", "NOAP"], "missingPrice must be empty, 'PNDG', or 'NOAP'"
+
+
+class TestPublicAPICache:
+    """Test the opt-in markets/assets cache without hitting the network."""
+
+    @staticmethod
+    def _api(cache_ttl: float) -> PublicAPI:
+        http = Mock(spec=HTTPClient)
+        http.request.return_value = Success([{"market": "BTC-EUR"}])
+        return PublicAPI(http, cache_ttl=cache_ttl)
+
+    def test_disabled_by_default(self) -> None:
+        public_api = self._api(0)
+
+        public_api.markets()
+        public_api.markets()
+
+        assert public_api.http.request.call_count == 2
+
+    def test_reuses_response_until_expiry(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        public_api = self._api(60)
+        now = 1000.0
+        monkeypatch.setattr(time, "monotonic", lambda: now)
+
+        first = public_api.markets()
+        assert public_api.markets() == first
+        public_api.markets({"market": "BTC-EUR"})  # different query, separate entry
+        assert public_api.http.request.call_count == 2
+
+        now += 61
+        public_api.markets()
+        assert public_api.http.request.call_count == 3
+
+    def test_failures_are_not_cached(self) -> None:
+        public_api = self._api(60)
+        public_api.http.request.return_value = Failure(httpx.ConnectError("down"))
+
+        public_api.assets()
+        public_api.assets()
+
+        assert public_api.http.request.call_count == 2
+
+
+class TestAsyncPublicAPI:
+    """Test AsyncPublicAPI without hitting the network."""
+
+    @pytest.fixture
+    def async_api(self) -> AsyncPublicAPI:
+        http = Mock(spec=AsyncHTTPClient)
+        http.request = AsyncMock(return_value=Success({"time": 1}))
+        return AsyncPublicAPI(http)
+
+    def test_requests_match_sync_api(self, async_api: AsyncPublicAPI) -> None:
+        async def run() -> None:
+            await asyncio.gather(
+                async_api.time(),
+                async_api.trades("BTC-EUR", {"limit": 5}),
+                async_api.candles("BTC-EUR", "1h"),
+                async_api.ticker_24h(),
+            )
+
+        asyncio.run(run())
+
+        calls = {call.args[1]: call.kwargs["weight"] for call in async_api.http.request.await_args_list}
+        assert calls == {
+            "/time": 1,
+            "/BTC-EUR/trades?limit=5": 5,
+            "/BTC-EUR/candles?interval=1h": 1,
+            "/ticker/24h": 25,
+        }
+
+    @pytest.mark.parametrize(
+        ("endpoint", "args"),
+        [
+            ("time", ()),
+            ("markets", ({"market": "BTC-EUR"},)),
+            ("assets", ({"symbol": "BTC"},)),
+            ("book", ("BTC-EUR", {"depth": 5})),
+            ("trades", ("BTC-EUR", {"limit": 5})),
+            ("candles", ("BTC-EUR", "1h", {"limit": 5})),
+            ("ticker_price", ({"market": "BTC-EUR"},)),
+            ("ticker_book", ({"market": "BTC-EUR"},)),
+            ("ticker_24h", ()),
+            ("report_book", ("BTC-EUR", {"depth": 5})),
+            ("report_trades", ("BTC-EUR", {"limit": 5})),
+        ],
+    )
+    def test_every_endpoint_sends_the_sync_request(
+        self,
+        async_api: AsyncPublicAPI,
+        endpoint: str,
+        args: tuple[Any, ...],
+    ) -> None:
+        sync_http = Mock(spec=HTTPClient)
+        sync_http.request.return_value = Success({})
+        getattr(PublicAPI(sync_http), endpoint)(*args)
+
+        asyncio.run(getattr(async_api, endpoint)(*args))
+
+        assert async_api.http.request.await_args_list == sync_http.request.call_args_list
+
+    def test_validates_like_sync_api(self, async_api: AsyncPublicAPI) -> None:
+        with pytest.raises(ValueError, match="depth must be an integer between 1 and 1000"):
+            asyncio.run(async_api.book("BTC-EUR", {"depth": 0}))
+        with pytest.raises(ValueError, match="interval must be one of"):
+            asyncio.run(async_api.candles("BTC-EUR", "2m"))  # type: ignore[arg-type]
+        async_api.http.request.assert_not_awaited()
+
+    def test_converts_to_preferred_model(self) -> None:
+        http = Mock(spec=AsyncHTTPClient)
+        http.request = AsyncMock(return_value=Success({"time": 1, "timeNs": 1_000_000}))
+        async_api = AsyncPublicAPI(http, preferred_model=ModelPreference.PYDANTIC)
+
+        result = asyncio.run(async_api.time())
+
+        assert isinstance(result.unwrap(), public_models.ServerTime)
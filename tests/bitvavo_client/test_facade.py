@@ -2,25 +2,39 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 from pydantic_settings import SettingsConfigDict
 from returns.result import Failure, Success
 
 from bitvavo_client.adapters.returns_adapter import BitvavoError
+from bitvavo_client.auth.rate_limit import RateLimitManager
 from bitvavo_client.core.model_preferences import ModelPreference
-from bitvavo_client.core.settings import BitvavoSettings
+from bitvavo_client.core.settings import ApiKey, BitvavoSettings
 from bitvavo_client.endpoints.private import PrivateAPI
-from bitvavo_client.endpoints.public import PublicAPI
+from bitvavo_client.endpoints.public import AsyncPublicAPI, PublicAPI
 from bitvavo_client.facade import BitvavoClient
+from bitvavo_client.transport.http import AsyncHTTPClient, HTTPClient
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Key sets shared by the tests below; ApiKey tuples are immutable and already in the settings' field type
+_DEFAULT_KEYS = (ApiKey("k", "s"),)
+_TEST_KEYS = (ApiKey("test_key", "test_secret"),)
+_TWO_KEYS = (ApiKey("key1", "secret1"), ApiKey("key2", "secret2"))
 
 
 class TestBitvavoSettings(BitvavoSettings):
     """Test-specific BitvavoSettings that disables ALL environment loading."""
 
+    __test__ = False  # settings, not a test class
+
     model_config = SettingsConfigDict(
         env_file=None,  # Disable .env file loading
         env_prefix="",  # Disable env var prefix to prevent env loading
@@ -36,7 +50,7 @@ class TestBitvavoSettings(BitvavoSettings):
             original_env[var] = os.environ.pop(var)
 
         try:
-            kwargs.setdefault("api_keys", [{"key": "k", "secret": "s"}])
+            kwargs.setdefault("api_keys", _DEFAULT_KEYS)
             super().__init__(**kwargs)
         finally:
             # Restore original environment
@@ -44,6 +58,18 @@ class TestBitvavoSettings(BitvavoSettings):
                 os.environ[var] = value
 
 
+@pytest.fixture(scope="module")
+def client() -> Iterator[BitvavoClient]:
+    """A client with the default test settings.
+
+    Construction wires up settings, rate limiter, HTTP clients and endpoint handlers, so tests that only read from the
+    client, or patch endpoint methods at class level, share this one. Tests that need other settings or close the
+    client build their own.
+    """
+    with BitvavoClient(TestBitvavoSettings()) as shared_client:
+        yield shared_client
+
+
 class TestBitvavoClientInitialization:
     def test_init_custom_settings(self) -> None:
         """Test initialization with custom settings."""
@@ -88,7 +114,7 @@ class TestBitvavoClientInitialization:
     def test_init_with_all_parameters(self) -> None:
         """Test initialization with all optional parameters."""
         # Create settings with test values using api_keys
-        settings = TestBitvavoSettings(api_keys=[{"key": "test_key", "secret": "test_secret"}])
+        settings = TestBitvavoSettings(api_keys=_TEST_KEYS)
         schema = {"market": str, "price": float}
 
         client = BitvavoClient(
@@ -109,19 +135,14 @@ class TestBitvavoClientAPIKeyConfiguration:
 
     def test_configure_single_api_key(self) -> None:
         """Test configuration with a single API key."""
-        settings = TestBitvavoSettings(api_keys=[{"key": "test_key", "secret": "test_secret"}])
+        settings = TestBitvavoSettings(api_keys=_TEST_KEYS)
         client = BitvavoClient(settings)
         assert client.http.api_key == "test_key"
         assert client.http.key_index == 0
 
     def test_configure_multiple_api_keys(self) -> None:
         """Test configuration with multiple API keys."""
-        settings = TestBitvavoSettings(
-            api_keys=[
-                {"key": "key1", "secret": "secret1"},
-                {"key": "key2", "secret": "secret2"},
-            ],
-        )
+        settings = TestBitvavoSettings(api_keys=_TWO_KEYS)
         client = BitvavoClient(settings)
         assert client.http.api_key == "key1"
         assert client.http.key_index == 0
@@ -153,10 +174,8 @@ class TestBitvavoClientComponentIntegration:
         assert client.http.settings is settings
         assert client.http.rate_limiter is client.rate_limiter
 
-    def test_api_endpoints_receive_http_client(self) -> None:
+    def test_api_endpoints_receive_http_client(self, client: BitvavoClient) -> None:
         """Test that API endpoints are initialized with HTTPClient."""
-        client = BitvavoClient(TestBitvavoSettings())
-
         # Both API endpoints should receive the same HTTP client
         assert client.public.http is client.http
         assert client.private.http is client.http
@@ -176,38 +195,136 @@ class TestBitvavoClientComponentIntegration:
         assert client.public.default_schema is schema
         assert client.private.default_schema is schema
 
+    def test_api_endpoints_use_slots(self, client: BitvavoClient) -> None:
+        """Test that the API endpoint handlers don't carry a per-instance __dict__."""
+        assert not hasattr(client.public, "__dict__")
+        assert not hasattr(client.private, "__dict__")
+        with pytest.raises(AttributeError):
+            client.public.some_new_attribute = 1  # type: ignore[attr-defined]
+
+    def test_context_manager_closes_http_client(self) -> None:
+        """Test that leaving the with-block closes the pooled HTTP connections."""
+        with BitvavoClient(TestBitvavoSettings()) as client:
+            assert not client.http._client.is_closed  # noqa: SLF001
+
+        assert client.http._client.is_closed  # noqa: SLF001
+
+    def test_async_context_manager_closes_both_http_clients(self) -> None:
+        """Test that the async public API shares settings and gets closed by `aclose()`."""
+
+        async def run() -> BitvavoClient:
+            async with BitvavoClient(TestBitvavoSettings()) as client:
+                assert isinstance(client.public_async, AsyncPublicAPI)
+                assert client.http_async.rate_limiter is client.rate_limiter
+            return client
+
+        client = asyncio.run(run())
+
+        assert client.http._client.is_closed  # noqa: SLF001
+        assert client.http_async._client.is_closed  # noqa: SLF001
+
+    def test_async_client_is_created_on_first_use(self) -> None:
+        """Test that a sync-only client never opens an httpx.AsyncClient."""
+        with BitvavoClient(TestBitvavoSettings()) as client:
+            assert isinstance(client.public, PublicAPI)
+
+        assert client._http_async is None  # noqa: SLF001
+        assert client.public_async.http is client.http_async
+        asyncio.run(client.aclose())
+
+    def test_context_manager_closes_used_async_client(self) -> None:
+        """Test that leaving a sync with-block also closes the async client once `snapshot()` has used it."""
+        sent: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            sent.append(request)
+            return httpx.Response(200, json=[])
+
+        with BitvavoClient(TestBitvavoSettings()) as client:
+            client.http_async._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+            asyncio.run(client.snapshot())
+
+        assert len(sent) == 3
+        assert client.http_async._client.is_closed  # noqa: SLF001
+
+    def test_close_inside_event_loop_warns_and_leaves_async_client_open(self) -> None:
+        """Test that `close()` inside a running loop points to `aclose()` instead of closing the async client."""
+
+        async def run() -> BitvavoClient:
+            client = BitvavoClient(TestBitvavoSettings())
+            client.http_async._client = httpx.AsyncClient(  # noqa: SLF001
+                transport=httpx.MockTransport(lambda _: httpx.Response(200, json=[])),
+            )
+            await client.snapshot()
+
+            with pytest.warns(ResourceWarning, match=r"use `await client\.aclose\(\)`"):
+                client.close()
+
+            assert not client.http_async._client.is_closed  # noqa: SLF001
+            await client.aclose()
+            return client
+
+        client = asyncio.run(run())
+
+        assert client.http_async._client.is_closed  # noqa: SLF001
+
+    def test_close_ignores_only_a_closed_event_loop(self) -> None:
+        """Test that `close()` tolerates connections left on a finished loop, but not other errors from `aclose()`."""
+        client = BitvavoClient(TestBitvavoSettings())
+        _ = client.http_async
+
+        with patch.object(AsyncHTTPClient, "aclose", side_effect=RuntimeError("Event loop is closed")):
+            client.close()
+        with (
+            patch.object(AsyncHTTPClient, "aclose", side_effect=RuntimeError("boom")),
+            pytest.raises(RuntimeError, match="boom"),
+        ):
+            client.close()
+
+        asyncio.run(client.aclose())
+
+    def test_snapshot_gathers_public_requests(self, client: BitvavoClient) -> None:
+        """Test that `snapshot()` returns the results of the async markets, assets and ticker_24h calls."""
+        with (
+            patch.object(AsyncPublicAPI, "markets", return_value=Success("markets")),
+            patch.object(AsyncPublicAPI, "assets", return_value=Success("assets")),
+            patch.object(AsyncPublicAPI, "ticker_24h", return_value=Success("ticker_24h")),
+        ):
+            snapshot = asyncio.run(client.snapshot())
+
+        assert snapshot.markets == Success("markets")
+        assert snapshot.assets == Success("assets")
+        assert snapshot.ticker_24h == Success("ticker_24h")
+
 
 class TestBitvavoClientPublicAPIAccess:
     """Test accessing public API methods through the client."""
 
     @patch("bitvavo_client.endpoints.public.PublicAPI.time")
-    def test_time_access(self, mock_time: Mock) -> None:
+    def test_time_access(self, mock_time: Mock, client: BitvavoClient) -> None:
         """Test accessing time endpoint through client."""
         mock_time.return_value = Success({"time": 1234567890, "timeNs": 1234567890123456})
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.public.time()
 
         mock_time.assert_called_once()
         assert isinstance(result, Success)
 
     @patch("bitvavo_client.endpoints.public.PublicAPI.markets")
-    def test_markets_access(self, mock_markets: Mock) -> None:
+    def test_markets_access(self, mock_markets: Mock, client: BitvavoClient) -> None:
         """Test accessing markets endpoint through client."""
         mock_markets.return_value = Success([{"market": "BTC-EUR", "status": "trading"}])
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.public.markets()
 
         mock_markets.assert_called_once()
         assert isinstance(result, Success)
 
     @patch("bitvavo_client.endpoints.public.PublicAPI.ticker_price")
-    def test_ticker_price_with_parameters(self, mock_ticker: Mock) -> None:
+    def test_ticker_price_with_parameters(self, mock_ticker: Mock, client: BitvavoClient) -> None:
         """Test accessing ticker price with parameters through client."""
         mock_ticker.return_value = Success([{"market": "BTC-EUR", "price": "50000"}])
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.public.ticker_price({"market": "BTC-EUR"})
 
         mock_ticker.assert_called_once_with({"market": "BTC-EUR"})
@@ -218,33 +335,30 @@ class TestBitvavoClientPrivateAPIAccess:
     """Test accessing private API methods through the client."""
 
     @patch("bitvavo_client.endpoints.private.PrivateAPI.account")
-    def test_account_access(self, mock_account: Mock) -> None:
+    def test_account_access(self, mock_account: Mock, client: BitvavoClient) -> None:
         """Test accessing account endpoint through client."""
         mock_account.return_value = Success({"fees": {"taker": "0.0025", "maker": "0.0015"}})
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.private.account()
 
         mock_account.assert_called_once()
         assert isinstance(result, Success)
 
     @patch("bitvavo_client.endpoints.private.PrivateAPI.balance")
-    def test_balance_access(self, mock_balance: Mock) -> None:
+    def test_balance_access(self, mock_balance: Mock, client: BitvavoClient) -> None:
         """Test accessing balance endpoint through client."""
         mock_balance.return_value = Success([{"symbol": "EUR", "available": "1000.00"}])
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.private.balance()
 
         mock_balance.assert_called_once()
         assert isinstance(result, Success)
 
     @patch("bitvavo_client.endpoints.private.PrivateAPI.get_order")
-    def test_get_order_with_parameters(self, mock_get_order: Mock) -> None:
+    def test_get_order_with_parameters(self, mock_get_order: Mock, client: BitvavoClient) -> None:
         """Test accessing get_order endpoint with parameters through client."""
         mock_get_order.return_value = Success({"orderId": "12345", "status": "filled"})
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.private.get_order("BTC-EUR", "67890")
 
         mock_get_order.assert_called_once_with("BTC-EUR", "67890")
@@ -255,24 +369,22 @@ class TestBitvavoClientErrorHandling:
     """Test error handling in BitvavoClient."""
 
     @patch("bitvavo_client.endpoints.public.PublicAPI.time")
-    def test_public_api_error_propagation(self, mock_time: Mock) -> None:
+    def test_public_api_error_propagation(self, mock_time: Mock, client: BitvavoClient) -> None:
         """Test that public API errors are properly propagated."""
         error = BitvavoError(http_status=500, error_code=1000, reason="Server Error", message="Internal error", raw={})
         mock_time.return_value = Failure(error)
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.public.time()
 
         assert isinstance(result, Failure)
         assert result.failure() is error
 
     @patch("bitvavo_client.endpoints.private.PrivateAPI.account")
-    def test_private_api_error_propagation(self, mock_account: Mock) -> None:
+    def test_private_api_error_propagation(self, mock_account: Mock, client: BitvavoClient) -> None:
         """Test that private API errors are properly propagated."""
         error = BitvavoError(http_status=401, error_code=1001, reason="Unauthorized", message="Auth failed", raw={})
         mock_account.return_value = Failure(error)
 
-        client = BitvavoClient(TestBitvavoSettings())
         result = client.private.account()
 
         assert isinstance(result, Failure)
@@ -282,7 +394,7 @@ class TestBitvavoClientErrorHandling:
 class TestBitvavoClientRealWorldUsage:
     """Test realistic usage patterns of BitvavoClient."""
 
-    def test_basic_public_api_workflow(self) -> None:
+    def test_basic_public_api_workflow(self, client: BitvavoClient) -> None:
         """Test a basic workflow using only public API."""
         with patch.multiple(
             "bitvavo_client.endpoints.public.PublicAPI",
@@ -290,8 +402,6 @@ class TestBitvavoClientRealWorldUsage:
             markets=Mock(return_value=Success([{"market": "BTC-EUR"}])),
             ticker_price=Mock(return_value=Success([{"market": "BTC-EUR", "price": "50000"}])),
         ):
-            client = BitvavoClient(TestBitvavoSettings())
-
             # Get server time
             time_result = client.public.time()
             assert isinstance(time_result, Success)
@@ -313,7 +423,7 @@ class TestBitvavoClientRealWorldUsage:
         ):
             # Create client with API credentials using api_keys
             settings = TestBitvavoSettings(
-                api_keys=[{"key": "test_key", "secret": "test_secret"}],
+                api_keys=_TEST_KEYS,
             )
             client = BitvavoClient(settings)
 
@@ -395,19 +505,33 @@ class TestBitvavoClientTypeCompatibility:
 class TestBitvavoClientDocumentation:
     """Test that BitvavoClient behavior matches its docstring."""
 
-    def test_backward_compatible_interface_claim(self) -> None:
+    def test_backward_compatible_interface_claim(self, client: BitvavoClient) -> None:
         """Test that the client provides backward-compatible interface."""
-        client = BitvavoClient(TestBitvavoSettings())
-        assert hasattr(client, "public")
-        assert hasattr(client, "private")
         assert isinstance(client.public, PublicAPI)
         assert isinstance(client.private, PrivateAPI)
 
-    def test_facade_pattern_implementation(self) -> None:
+    def test_facade_pattern_implementation(self, client: BitvavoClient) -> None:
         """Test that the client implements the facade pattern correctly."""
-        client = BitvavoClient(TestBitvavoSettings())
-        assert hasattr(client, "settings")
-        assert hasattr(client, "rate_limiter")
-        assert hasattr(client, "http")
-        assert hasattr(client, "public")
-        assert hasattr(client, "private")
+        assert isinstance(client.settings, BitvavoSettings)
+        assert isinstance(client.rate_limiter, RateLimitManager)
+        assert isinstance(client.http, HTTPClient)
+        assert client.public.http is client.http
+        assert client.private.http is client.http
+
+
+class TestPackageExports:
+    """Test the names exported from the `bitvavo_client` package."""
+
+    def test_client_is_exported_lazily(self) -> None:
+        """Test that `bitvavo_client.BitvavoClient` resolves to the facade class."""
+        import bitvavo_client  # noqa: PLC0415
+
+        assert bitvavo_client.BitvavoClient is BitvavoClient
+        assert "BitvavoClient" in bitvavo_client.__all__
+
+    def test_unknown_attribute(self) -> None:
+        """Test that unknown attributes still raise AttributeError."""
+        import bitvavo_client  # noqa: PLC0415
+
+        with pytest.raises(AttributeError, match="has no attribute 'Bitvavo'"):
+            _ = bitvavo_client.Bitvavo
@@ -2,23 +2,33 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
 from unittest.mock import patch
 
 import httpx
-from returns.result import Success
+import pytest
+from returns.result import Failure, Success
 
 from bitvavo_client.auth.rate_limit import RateLimitManager
+from bitvavo_client.auth.signing import create_signature, encode_body
 from bitvavo_client.core.settings import BitvavoSettings
-from bitvavo_client.transport.http import HTTPClient
+from bitvavo_client.transport.http import AsyncHTTPClient, HTTPClient, _cached_ssl_context
 
-if TYPE_CHECKING:  # pragma: no cover
-    import pytest
 
+@pytest.fixture(scope="module")
+def settings() -> BitvavoSettings:
+    """Single-key settings; the clients only read them, so one instance serves every test."""
+    return BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
 
-def test_request_updates_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
+
+@pytest.fixture(scope="module")
+def two_key_settings() -> BitvavoSettings:
+    """Settings with two API keys, for the key rotation tests."""
+    return BitvavoSettings(api_keys=[{"key": "k1", "secret": "s1"}, {"key": "k2", "secret": "s2"}])
+
+
+def test_request_updates_rate_limiter(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
     """HTTPClient.request should record weight usage for each call."""
-    settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
     manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
     client = HTTPClient(settings, manager)
 
@@ -38,9 +48,8 @@ def test_request_updates_rate_limiter(monkeypatch: pytest.MonkeyPatch) -> None:
     assert manager.get_remaining(0) == start_remaining - 6
 
 
-def test_initial_rate_limit_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_initial_rate_limit_fetch(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
     """Initial request should fetch rate limit before making the API call."""
-    settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
     manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
     client = HTTPClient(settings, manager)
 
@@ -63,9 +72,8 @@ def test_initial_rate_limit_fetch(monkeypatch: pytest.MonkeyPatch) -> None:
     assert manager.get_remaining(0) == 995
 
 
-def test_initial_rate_limit_handles_429(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_initial_rate_limit_handles_429(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
     """Client should sleep and retry when initial check returns 429 error 101."""
-    settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}])
     manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
     client = HTTPClient(settings, manager)
 
@@ -134,13 +142,12 @@ def test_initial_rate_limit_below_threshold(monkeypatch: pytest.MonkeyPatch) ->
     assert manager.get_remaining(0) == 995
 
 
-def test_request_rotates_keys_when_budget_exhausted(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_request_rotates_keys_when_budget_exhausted(
+    two_key_settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Client should rotate to next API key when current key has no budget."""
-    settings = BitvavoSettings(
-        api_keys=[{"key": "k1", "secret": "s1"}, {"key": "k2", "secret": "s2"}],
-    )
-    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
-    client = HTTPClient(settings, manager)
+    manager = RateLimitManager(two_key_settings.default_rate_limit, two_key_settings.rate_limit_buffer)
+    client = HTTPClient(two_key_settings, manager)
 
     # Skip initial rate limit call
     monkeypatch.setattr(client, "_ensure_rate_limit_initialized", lambda: None)
@@ -162,13 +169,12 @@ def test_request_rotates_keys_when_budget_exhausted(monkeypatch: pytest.MonkeyPa
     assert client.key_index == 1
 
 
-def test_rotate_key_does_not_reset_when_budget_available(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_rotate_key_does_not_reset_when_budget_available(
+    two_key_settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Rotation should not reset key state if the key still has budget."""
-    settings = BitvavoSettings(
-        api_keys=[{"key": "k1", "secret": "s1"}, {"key": "k2", "secret": "s2"}],
-    )
-    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
-    client = HTTPClient(settings, manager)
+    manager = RateLimitManager(two_key_settings.default_rate_limit, two_key_settings.rate_limit_buffer)
+    client = HTTPClient(two_key_settings, manager)
 
     manager.state[1]["remaining"] = 500
     manager.state[1]["resetAt"] = 0
@@ -180,13 +186,10 @@ def test_rotate_key_does_not_reset_when_budget_available(monkeypatch: pytest.Mon
     mock_reset.assert_not_called()
 
 
-def test_rotate_key_resets_expired_key(monkeypatch: pytest.MonkeyPatch) -> None:
+def test_rotate_key_resets_expired_key(two_key_settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
     """Rotation should reset key if its budget is exhausted and reset time passed."""
-    settings = BitvavoSettings(
-        api_keys=[{"key": "k1", "secret": "s1"}, {"key": "k2", "secret": "s2"}],
-    )
-    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
-    client = HTTPClient(settings, manager)
+    manager = RateLimitManager(two_key_settings.default_rate_limit, two_key_settings.rate_limit_buffer)
+    client = HTTPClient(two_key_settings, manager)
 
     manager.state[1]["remaining"] = 0
     manager.state[1]["resetAt"] = 0
@@ -196,3 +199,214 @@ def test_rotate_key_resets_expired_key(monkeypatch: pytest.MonkeyPatch) -> None:
 
     assert client.key_index == 1
     mock_reset.assert_called_once_with(1)
+
+
+def test_requests_share_one_pooled_client(settings: BitvavoSettings) -> None:
+    """All requests should go through the same httpx.Client, so connections get reused."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+
+    seen: list[tuple[str, str, bytes]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.method, request.url.path, request.content))
+        return httpx.Response(200, json={})
+
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))  # noqa: SLF001
+
+    client.request("GET", "/time")
+    client.request("POST", "/order", body={"market": "BTC-EUR"})
+    client.request("DELETE", "/order?orderId=1")
+
+    assert seen == [
+        ("GET", "/v2/account", b""),  # initial rate limit fetch
+        ("GET", "/v2/time", b""),
+        ("POST", "/v2/order", b'{"market":"BTC-EUR"}'),
+        ("DELETE", "/v2/order", b""),
+    ]
+
+
+def test_sent_body_is_the_signed_body(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The request body should be the exact bytes the signature was computed over, also for non-ASCII values."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+    monkeypatch.setattr(client, "_ensure_rate_limit_initialized", lambda: None)
+
+    seen: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        return httpx.Response(200, json={})
+
+    client._client = httpx.Client(transport=httpx.MockTransport(handler))  # noqa: SLF001
+
+    body = {"symbol": "BTC", "amount": "1", "address": "addr", "paymentId": "café"}
+    client.request("POST", "/withdrawal", body=body)
+
+    request = seen[0]
+    timestamp = int(request.headers["bitvavo-access-timestamp"])
+    assert request.headers["content-type"] == "application/json"
+    assert request.content == encode_body(body)
+    assert request.headers["bitvavo-access-signature"] == create_signature(timestamp, "POST", "/withdrawal", body, "s")
+
+
+def test_clients_share_one_ssl_context(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """The CA bundle should be loaded once, not for every pooled client, until the CA location changes."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    monkeypatch.delenv("SSL_CERT_DIR", raising=False)
+    _cached_ssl_context.cache_clear()
+
+    with patch("httpx.create_ssl_context", wraps=httpx.create_ssl_context) as mock_create:
+        HTTPClient(settings, manager).close()
+        asyncio.run(AsyncHTTPClient(settings, manager).aclose())
+        HTTPClient(settings, manager).close()
+        assert mock_create.call_count == 1
+
+        monkeypatch.setenv("SSL_CERT_DIR", "/nonexistent")
+        monkeypatch.delenv("SSL_CERT_FILE", raising=False)
+        HTTPClient(settings, manager).close()
+        assert mock_create.call_count == 2
+
+
+def test_unsupported_method_is_rejected(settings: BitvavoSettings) -> None:
+    """Methods outside GET/POST/PUT/DELETE should raise before anything is signed, recorded or sent."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+    sent: list[httpx.Request] = []
+    client._client = httpx.Client(transport=httpx.MockTransport(sent.append))  # noqa: SLF001
+
+    with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+        client.request("PATCH", "/order")
+
+    assert sent == []
+    assert manager.get_remaining(0) == settings.default_rate_limit
+
+
+def test_async_unsupported_method_is_rejected(settings: BitvavoSettings) -> None:
+    """The async client should reject the same methods as the sync one, before signing or sending."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = AsyncHTTPClient(settings, manager)
+    sent: list[httpx.Request] = []
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(sent.append))  # noqa: SLF001
+
+    with pytest.raises(ValueError, match="Unsupported HTTP method: PATCH"):
+        asyncio.run(client.request("PATCH", "/order"))
+
+    assert sent == []
+    assert manager.get_remaining(0) == settings.default_rate_limit
+
+
+def test_close_and_context_manager(settings: BitvavoSettings) -> None:
+    """Closing the HTTPClient should close the pooled httpx.Client."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+
+    with HTTPClient(settings, manager) as client:
+        assert not client._client.is_closed  # noqa: SLF001
+
+    assert client._client.is_closed  # noqa: SLF001
+
+
+def test_async_client_requests_share_one_pooled_client(settings: BitvavoSettings) -> None:
+    """Concurrent async requests should go through the same httpx.AsyncClient and record their weight."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = AsyncHTTPClient(settings, manager)
+
+    seen: list[tuple[str, bool]] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, "bitvavo-access-signature" in request.headers))
+        return httpx.Response(200, json={})
+
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+
+    async def run() -> list[object]:
+        async with client:
+            return await asyncio.gather(client.request("GET", "/time"), client.request("GET", "/markets", weight=5))
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(result, Success) for result in results)
+    assert sorted(seen) == [("/v2/markets", True), ("/v2/time", True)]
+    assert manager.get_remaining(0) == settings.default_rate_limit - 6
+    assert client._client.is_closed  # noqa: SLF001
+
+
+def test_async_client_without_keys_sends_unsigned_requests() -> None:
+    """Public endpoints don't need a key, so the async client should work without one."""
+    settings = BitvavoSettings(api_keys=[])
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = AsyncHTTPClient(settings, manager)
+
+    seen_headers: list[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        return httpx.Response(200, json={})
+
+    client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))  # noqa: SLF001
+
+    result = asyncio.run(client.request("GET", "/time"))
+
+    assert isinstance(result, Success)
+    assert "bitvavo-access-key" not in seen_headers[0]
+
+
+def test_auth_headers_use_integer_millisecond_timestamp() -> None:
+    """The signed timestamp should be exact milliseconds plus the configured lag."""
+    settings = BitvavoSettings(api_keys=[{"key": "k", "secret": "s"}], lag_ms=7, access_window_ms=5_000)
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+
+    with patch("time.time_ns", return_value=1_700_000_000_123_999_999):
+        headers = client._create_auth_headers("GET", "/time", b"")  # noqa: SLF001
+
+    assert headers["bitvavo-access-timestamp"] == "1700000000130"
+    assert headers["bitvavo-access-window"] == "5000"
+
+
+def test_auth_headers_follow_selected_key(two_key_settings: BitvavoSettings) -> None:
+    """Cached key headers should be rebuilt on key selection and not leak signatures between requests."""
+    manager = RateLimitManager(two_key_settings.default_rate_limit, two_key_settings.rate_limit_buffer)
+    client = HTTPClient(two_key_settings, manager)
+
+    first = client._create_auth_headers("GET", "/time", b"")  # noqa: SLF001
+    client.select_key(1)
+    second = client._create_auth_headers("GET", "/time", b"")  # noqa: SLF001
+
+    assert first["bitvavo-access-key"] == "k1"
+    assert second["bitvavo-access-key"] == "k2"
+    assert "bitvavo-access-signature" not in client._base_headers  # noqa: SLF001
+
+
+def test_successful_response_body_is_decoded_once(settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Rate limit bookkeeping shouldn't decode successful bodies; that's left to decode_response_result."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+    client._rate_limit_initialized = True  # noqa: SLF001
+
+    response = httpx.Response(200, headers={"bitvavo-ratelimit-remaining": "900"}, json=[{"market": "BTC-EUR"}])
+    monkeypatch.setattr(client, "_make_http_request", lambda m, u, h, b: response)
+
+    with patch.object(httpx.Response, "json", autospec=True, side_effect=httpx.Response.json) as mock_json:
+        result = client.request("GET", "/markets")
+
+    assert result == Success([{"market": "BTC-EUR"}])
+    assert mock_json.call_count == 1
+    assert manager.get_remaining(0) == 900
+
+
+def test_rate_limit_error_response_updates_from_error(
+    settings: BitvavoSettings, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A 429 response should still be recognised as a rate limit error."""
+    manager = RateLimitManager(settings.default_rate_limit, settings.rate_limit_buffer)
+    client = HTTPClient(settings, manager)
+    client._rate_limit_initialized = True  # noqa: SLF001
+
+    response = httpx.Response(429, json={"errorCode": 105, "error": "Rate limit exceeded"})
+    monkeypatch.setattr(client, "_make_http_request", lambda m, u, h, b: response)
+
+    result = client.request("GET", "/markets")
+
+    assert isinstance(result, Failure)
+    assert manager.get_remaining(0) == 0